@@ -1,17 +1,137 @@
 # agents/agent_base.py
 
+import asyncio
+import atexit
+import json
+import logging
+import math
+import os
+import queue
+import re
+import sys
+import time
 import uuid
 import datetime
+from logging.handlers import QueueHandler, QueueListener
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from config.company_profile import company_profile
+from utils.memory_writer import memory_writer
+from utils.short_term_memory import ShortTermMemory
+
+_logger = logging.getLogger("agents")
+
+
+class _AgentLogFormatter(logging.Formatter):
+    """Formats records as '[name | role] <utc iso timestamp> -> message'; records from other
+    loggers under "agents" (which carry no agent_prefix) are prefixed with '[agents]'"""
+
+    def __init__(self):
+        super().__init__("%(agent_prefix)s %(asctime)s -> %(message)s", defaults={"agent_prefix": "[agents]"})
+
+    def formatTime(self, record, datefmt=None):
+        return datetime.datetime.utcfromtimestamp(record.created).isoformat()
+
+
+def _configure_agent_logger():
+    """Route agent logs to stdout through a background QueueListener, unless the app configured them"""
+    if _logger.handlers:
+        return
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_AgentLogFormatter())
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    _logger.addHandler(QueueHandler(log_queue))
+    _logger.setLevel(logging.INFO)
+    _logger.propagate = False
+
+
+_configure_agent_logger()
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7): 48-bit Unix ms timestamp followed by random bits"""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+class _LogStream:
+    """Logs streamed LLM output one paragraph at a time under a header"""
+
+    def __init__(self, log, header: str):
+        self._log = log
+        self._header = header
+        self._buffer = ""
+        self._started = False
+
+    def write(self, chunk: str):
+        self._buffer += chunk
+        *paragraphs, self._buffer = self._buffer.split("\n\n")
+        for paragraph in paragraphs:
+            self._emit(paragraph)
+
+    def close(self, text: str):
+        """Log what is left; if nothing was streamed (e.g. a cache hit), log text in full"""
+        if self._started:
+            self._emit(self._buffer)
+        else:
+            self._log(f"{self._header}\n{text}")
+        self._buffer = ""
+
+    def _emit(self, paragraph: str):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            return
+        if not self._started:
+            self._log(self._header)
+            self._started = True
+        self._log(paragraph)
+
+# Output category for generated documents, by lowercased department (default: 'docs')
+_DEPT_TO_CATEGORY = {
+    'rnd': 'reports', 'r&d': 'reports', 'research': 'reports',
+    'marketing': 'docs', 'sales': 'docs',
+    'finance': 'reports', 'accounting': 'reports'
+}
+
+# Document builders by lowercased doc type: (DocumentGenerator call, file extension)
+_DOC_BUILDERS = {
+    'docx': (lambda doc_gen, content: doc_gen.create_docx(content), '.docx'),
+    'pptx': (lambda doc_gen, content: doc_gen.create_pptx(content.get('slides', [])), '.pptx'),
+    'xlsx': (lambda doc_gen, content: doc_gen.create_xlsx(content), '.xlsx'),
+    'pdf': (lambda doc_gen, content: doc_gen.create_pdf(content), '.pdf')
+}
 
 class AgentBase(ABC):
+    # In-process cache for memory retrievals, shared by all agents and created on first use.
+    # Keys include agent_id and a per-agent version that is bumped on every store.
+    RETRIEVAL_CACHE_SIZE = 1024
+    RETRIEVAL_CACHE_TTL = 60
+    _retrieval_cache = None
+
+    # Multi-factor memory scoring: weights for (recency, importance, relevance), recency decay
+    # constant, and how many candidates to fetch per requested result before rescoring
+    RETRIEVAL_WEIGHTS = (1.0, 1.0, 1.0)
+    RECENCY_DECAY_SECONDS = 3600.0
+    RETRIEVAL_CANDIDATE_FACTOR = 4
+
+    # Short-term memory tier: recent task results searched in-process before the memory store
+    STM_MAX_ENTRIES = 256
+    STM_SIMILARITY_THRESHOLD = 0.5
+
     def __init__(self, name, department, role, memory=None, memory_manager=None, research_agent=None):
-        self.agent_id = str(uuid.uuid4())
+        # Time-ordered ID keeps agent_id-filtered rows close together in the memory store's indexes
+        self.agent_id = str(uuid7())
         self.name = name
         self.department = department
         self.role = role
+        self._dept_lc = department.lower()
+        # Structured fields on every log record, for handlers that emit JSON; agent_prefix feeds the text format
+        self._log_extra = {"agent_prefix": f"[{name} | {role}]", "agent_name": name, "department": department, "role": role}
+        self._meta_base = {"agent_name": name, "department": department, "role": role}
         
         # Handle backward compatibility for memory parameter
         if memory_manager is not None:
@@ -24,8 +144,11 @@ class AgentBase(ABC):
         else:
             self.memory = None
             self.memory_manager = None
+        self._memory_version = 0
+        self._stm = ShortTermMemory(self.STM_MAX_ENTRIES, self.STM_SIMILARITY_THRESHOLD)
             
         self.research_agent = research_agent
+        self._message_tasks = set()  # In-flight dispatch_messages tasks, referenced until done
         self.created_at = datetime.datetime.utcnow()
         
         # File management and session support
@@ -33,25 +156,48 @@ class AgentBase(ABC):
         self.session_manager = None
         self.current_mode = "persistent"  # Default mode
 
-    def log(self, message: str):
-        timestamp = datetime.datetime.utcnow().isoformat()
-        print(f"[{self.name} | {self.role}] {timestamp} -> {message}")
+    def log(self, message: str, *args, level: int = logging.INFO):
+        """Log message, %-formatted with args only if the level is enabled; pass values as args
+        rather than pre-formatting them so filtered records cost no string building"""
+        # Formatting (timestamp included) happens in the listener thread
+        _logger.log(level, message, *args, extra=self._log_extra)
+
+    def log_stream(self, header: str) -> _LogStream:
+        """Start logging a streamed LLM response paragraph by paragraph"""
+        return _LogStream(self.log, header)
 
     def save_to_memory(self, task: str, result: str):
         """ Store task-result pair to memory """
+        content, metadata = self._record_short_term(task, result)
+        return self._persist_memory(task, result, content, metadata)
+
+    def save_to_memory_async(self, task: str, result: str):
+        """Store task-result pair to memory without waiting for the persistent write"""
+        content, metadata = self._record_short_term(task, result)
+        memory_writer.submit(self._persist_memory_in_background, task, result, content, metadata)
+
+    def _record_short_term(self, task: str, result: str):
+        """Add a task-result pair to short-term memory and invalidate cached retrievals"""
+        content = f"Task: {task}\nResult: {result}"
+        metadata = {**self._meta_base, "task": task, "timestamp_ns": time.time_ns()}
+        self._stm.add(content, metadata)
+        if self.memory_manager:
+            self._memory_version += 1
+        return content, metadata
+
+    def _persist_memory_in_background(self, task: str, result: str, content: str, metadata: dict):
+        self._persist_memory(task, result, content, metadata)
+        if self.memory_manager:
+            # Retrievals cached while the write was queued did not see it
+            self._memory_version += 1
+
+    def _persist_memory(self, task: str, result: str, content: str, metadata: dict):
         if self.memory_manager:
             # Use centralized memory system
-            metadata = {
-                "task": task,
-                "agent_name": self.name,
-                "department": self.department,
-                "role": self.role,
-                "timestamp": datetime.datetime.utcnow().isoformat()
-            }
             return self.memory_manager.store_data(
                 agent_id=self.agent_id,
                 data_type="task_result",
-                content=f"Task: {task}\nResult: {result}",
+                content=content,
                 metadata=metadata
             )
         elif self.memory:
@@ -63,7 +209,18 @@ class AgentBase(ABC):
 
     def retrieve_memory(self, query: str, top_k: int = 3):
         """ Fetch similar past memory"""
+        # Short-term tier first; only go to the memory store when it cannot fill top_k
+        stm_hits = self._stm.search(query, top_k)
+        if len(stm_hits) >= top_k:
+            return stm_hits
+        
         if self.memory_manager:
+            cache = self._get_retrieval_cache()
+            cache_key = self._retrieval_cache_key("retrieve", query, top_k)
+            cached_results = cache.get(cache_key)
+            if cached_results is not None:
+                return cached_results
+            
             # Use centralized memory system
             filters = {
                 "agent_id": self.agent_id,
@@ -73,30 +230,85 @@ class AgentBase(ABC):
                 agent_id=self.agent_id,
                 query=query,
                 data_type="task_result",
-                filters=filters
+                filters=filters,
+                limit=top_k * self.RETRIEVAL_CANDIDATE_FACTOR
             )
             
             # Extract results for backward compatibility
-            if result.get("status") == "success":
-                return result.get("results", [])[:top_k]
+            if result.get("status") in ("success", "retrieved"):
+                # Union of short-term hits and stored memories, skipping stored copies of STM entries
+                stm_contents = {hit["content"] for hit in stm_hits}
+                candidates = stm_hits + [r for r in result.get("results", []) if r.get("content") not in stm_contents]
+                results = self._rank_memories(query, candidates, top_k)
+                cache.put(cache_key, results)
+                return results
             else:
                 self.log(f"Memory retrieval failed: {result.get('message', 'Unknown error')}")
-                return []
+                return stm_hits
         elif self.memory:
             # Backward compatibility with old memory system
             return self.memory.search(agent_id=self.agent_id, query=query, top_k=top_k)
         else:
+            if stm_hits:
+                return stm_hits
             self.log("Warning: No memory system available for retrieving data")
             return []
 
+    def _rank_memories(self, query: str, candidates: list, top_k: int) -> list:
+        """Rank memory candidates by weighted recency, importance and relevance and keep the top_k"""
+        if len(candidates) <= 1:
+            return candidates[:top_k]
+        
+        w_recency, w_importance, w_relevance = self.RETRIEVAL_WEIGHTS
+        now = time.time()
+        query_terms = set(re.findall(r"\w+", query.lower()))
+        
+        scored = []
+        for candidate in candidates:
+            metadata = candidate.get("metadata") or {}
+            
+            # Recency: exponential decay on age, from the stored ns timestamp or the row's created_at
+            if "timestamp_ns" in metadata:
+                created = metadata["timestamp_ns"] / 1e9
+            else:
+                try:
+                    created = datetime.datetime.fromisoformat(candidate["created_at"]).timestamp()
+                except (KeyError, TypeError, ValueError):
+                    created = now
+            recency = math.exp(-max(now - created, 0.0) / self.RECENCY_DECAY_SECONDS)
+            
+            try:
+                importance = min(max(float(metadata.get("importance", 0.5)), 0.0), 1.0)
+            except (TypeError, ValueError):
+                importance = 0.5
+            
+            # Relevance: similarity score when the store provides one, else query term overlap
+            if "similarity_score" in candidate:
+                relevance = candidate["similarity_score"]
+            elif query_terms:
+                content_terms = set(re.findall(r"\w+", str(candidate.get("content", "")).lower()))
+                relevance = len(query_terms & content_terms) / len(query_terms)
+            else:
+                relevance = 0.0
+            
+            scored.append((w_recency * recency + w_importance * importance + w_relevance * relevance, candidate))
+        
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [candidate for _, candidate in scored[:top_k]]
+
     def request_permission(self, task_description: str):
         """ Stub for user approval – override with actual logic later """
         self.log(f"Requesting user approval for: {task_description}")
         return True  # Always approved for now (simulate interactive permission)
 
+    @property
+    def company_context(self) -> dict:
+        """Company profile context; cached on the profile and rebuilt only when it changes"""
+        return company_profile.get_context_dict()
+
     def get_company_context(self):
         """Get company profile context"""
-        return company_profile.get_context()
+        return self.company_context
 
     async def request_research(self, research_query: str):
         """Request research from the centralized research agent"""
@@ -117,6 +329,25 @@ class AgentBase(ABC):
         """Stub for sending a message to another agent. Should be overridden or connected to the system's messaging infrastructure."""
         self.log(f"🔔 Signaling {receiver_name} via message_sent_event.")
         # Integrate with actual messaging/event system here
+
+    async def async_send_message_to(self, receiver_name: str, message: str):
+        """send_message_to in a worker thread, so a blocking transport never stalls the event loop"""
+        await asyncio.to_thread(self.send_message_to, receiver_name, message)
+
+    def dispatch_messages(self, *messages: Tuple[str, str]) -> asyncio.Task:
+        """Send (receiver_name, message) pairs concurrently in the background without waiting"""
+        task = asyncio.create_task(self._send_messages(messages))
+        self._message_tasks.add(task)
+        task.add_done_callback(self._message_task_done)
+        return task
+
+    async def _send_messages(self, messages):
+        await asyncio.gather(*(self.async_send_message_to(receiver, message) for receiver, message in messages))
+
+    def _message_task_done(self, task: asyncio.Task):
+        self._message_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.log("⚠️ Failed to deliver messages: %s", task.exception(), level=logging.WARNING)
     
     # Additional memory system methods for centralized memory integration
     
@@ -157,12 +388,9 @@ class AgentBase(ABC):
         if self.memory_manager:
             if metadata is None:
                 metadata = {}
-            metadata.update({
-                "agent_name": self.name,
-                "department": self.department,
-                "role": self.role,
-                "timestamp": datetime.datetime.utcnow().isoformat()
-            })
+            metadata.update(self._meta_base)
+            metadata["timestamp_ns"] = time.time_ns()
+            self._memory_version += 1
             return self.memory_manager.store_data(
                 agent_id=self.agent_id,
                 data_type=data_type,
@@ -179,11 +407,32 @@ class AgentBase(ABC):
             if filters is None:
                 filters = {}
             filters["agent_id"] = self.agent_id
-            return self.memory_manager.search_similar(query, top_k, filters)
+            cache = self._get_retrieval_cache()
+            cache_key = self._retrieval_cache_key("search", query, top_k, filters)
+            cached_result = cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+            result = self.memory_manager.search_similar(query, top_k, filters)
+            if result.get("status") != "error":
+                cache.put(cache_key, result)
+            return result
         else:
             self.log("Warning: No memory manager available for knowledge search")
             return {"status": "no_memory_manager", "message": "No memory manager configured"}
     
+    def _get_retrieval_cache(self):
+        """Get the shared retrieval cache, creating it on first use"""
+        if AgentBase._retrieval_cache is None:
+            # Imported lazily: agents.memory itself depends on this module
+            from agents.memory.cache_manager import LRUCache
+            AgentBase._retrieval_cache = LRUCache(max_size=self.RETRIEVAL_CACHE_SIZE, default_ttl=self.RETRIEVAL_CACHE_TTL)
+        return AgentBase._retrieval_cache
+    
+    def _retrieval_cache_key(self, kind: str, query: str, top_k: int, filters: dict = None) -> str:
+        """Build a retrieval cache key that is invalidated by this agent's next store"""
+        filters_key = json.dumps(filters or {}, sort_keys=True, default=str)
+        return f"{kind}:{self.agent_id}:v{self._memory_version}:k{top_k}:{filters_key}:{query}"
+    
     # File Management Methods
     
     def set_file_manager(self, file_manager):
@@ -213,18 +462,15 @@ class AgentBase(ABC):
             return None
         
         try:
-            # Convert content to bytes if it's a string
-            if isinstance(content, str):
-                content_bytes = content.encode('utf-8')
-            elif isinstance(content, bytes):
-                content_bytes = content
+            # Text and binary content go straight to the file manager (it writes str as UTF-8)
+            if isinstance(content, (str, bytes, bytearray, memoryview)):
+                file_content = content
             else:
-                # For other types, convert to JSON string then bytes
-                import json
-                content_bytes = json.dumps(content, indent=2).encode('utf-8')
+                # For other types, serialize to a JSON string
+                file_content = json.dumps(content, indent=2)
             
             file_path = self.file_manager.save_file(
-                content=content_bytes,
+                content=file_content,
                 filename=filename,
                 category=category,
                 agent_name=self.name
@@ -277,34 +523,16 @@ class AgentBase(ABC):
             
             doc_gen = DocumentGenerator()
             
-            if doc_type.lower() == 'docx':
-                doc_bytes = doc_gen.create_docx(content)
-                if not filename.endswith('.docx'):
-                    filename += '.docx'
-            elif doc_type.lower() == 'pptx':
-                doc_bytes = doc_gen.create_pptx(content.get('slides', []))
-                if not filename.endswith('.pptx'):
-                    filename += '.pptx'
-            elif doc_type.lower() == 'xlsx':
-                doc_bytes = doc_gen.create_xlsx(content)
-                if not filename.endswith('.xlsx'):
-                    filename += '.xlsx'
-            elif doc_type.lower() == 'pdf':
-                doc_bytes = doc_gen.create_pdf(content)
-                if not filename.endswith('.pdf'):
-                    filename += '.pdf'
-            else:
+            builder = _DOC_BUILDERS.get(doc_type.lower())
+            if builder is None:
                 raise ValueError(f"Unsupported document type: {doc_type}")
+            build, extension = builder
+            doc_bytes = build(doc_gen, content)
+            if not filename.endswith(extension):
+                filename += extension
             
-            # Determine category based on document type and agent department
-            if self.department.lower() in ['rnd', 'r&d', 'research']:
-                category = 'reports'
-            elif self.department.lower() in ['marketing', 'sales']:
-                category = 'docs'
-            elif self.department.lower() in ['finance', 'accounting']:
-                category = 'reports'
-            else:
-                category = 'docs'
+            # Determine category based on agent department
+            category = _DEPT_TO_CATEGORY.get(self._dept_lc, 'docs')
             
             return self.save_output_file(doc_bytes, filename, category)
             
@@ -1,10 +1,16 @@
 from dotenv import load_dotenv
 load_dotenv()
 from agents.agent_base import AgentBase
+from agents.engineering.workspace import get_workspace_path
+from utils.file_manager import iter_files
+import asyncio
 import os
 import subprocess
 import logging
-import requests
+import zipfile
+from utils.http_session import http_session
+
+WEBHOOK_TIMEOUT = 10
 
 class GitHubTool:
     def __init__(self, repo_path, remote="origin"):
@@ -14,44 +20,36 @@ class GitHubTool:
         self.username = os.environ.get("GITHUB_USERNAME")
 
     def git_add_commit_push(self, commit_message):
-        cmds = [
-            ["git", "add", "."],
-            ["git", "commit", "-m", commit_message]
-        ]
-        for cmd in cmds:
-            try:
-                subprocess.check_output(cmd, cwd=self.repo_path)
-            except subprocess.CalledProcessError as e:
-                logging.error(f"Git command failed: {e.output}")
-                return False
-        # Push with authentication if token is provided
-        push_cmd = ["git", "push", self.remote, "HEAD"]
-        env = os.environ.copy()
+        env = None
         if self.token and self.username:
+            # Push with authentication if token is provided
+            env = os.environ.copy()
             env["GIT_ASKPASS"] = "echo"
             env["GIT_USERNAME"] = self.username
             env["GIT_PASSWORD"] = self.token
-            # Use HTTPS remote with token
-            try:
-                subprocess.check_output(push_cmd, cwd=self.repo_path, env=env)
-            except subprocess.CalledProcessError as e:
-                logging.error(f"Git push failed: {e.output}")
-                return False
-        else:
-            try:
-                subprocess.check_output(push_cmd, cwd=self.repo_path)
-            except subprocess.CalledProcessError as e:
-                logging.error(f"Git push failed: {e.output}")
+        # "commit -a" would skip untracked files generated in the workspace, so stage with "add -A"
+        cmds = [
+            ["git", "add", "-A"],
+            ["git", "commit", "-q", "-m", commit_message],
+            ["git", "push", "-q", self.remote, "HEAD"]
+        ]
+        for cmd in cmds:
+            result = subprocess.run(cmd, cwd=self.repo_path, env=env, capture_output=True)
+            if result.returncode != 0:
+                logging.error(f"Git {cmd[1]} failed: {result.stderr or result.stdout}")
                 return False
         return True
 
 class DeploymentTool:
-    def trigger_deployment(self):
+    async def trigger_deployment(self):
+        return await asyncio.to_thread(self._trigger_deployment)
+
+    def _trigger_deployment(self):
         # Example: Trigger a deployment webhook (replace URL with your actual endpoint)
         deployment_url = os.environ.get("DEPLOYMENT_WEBHOOK_URL")
         if deployment_url:
             try:
-                response = requests.post(deployment_url)
+                response = http_session.post(deployment_url, timeout=WEBHOOK_TIMEOUT)
                 if response.status_code == 200:
                     logging.info("Deployment pipeline triggered via webhook.")
                     return True
@@ -66,12 +64,15 @@ class DeploymentTool:
             return True
 
 class CICDTool:
-    def trigger_cicd(self):
+    async def trigger_cicd(self):
+        return await asyncio.to_thread(self._trigger_cicd)
+
+    def _trigger_cicd(self):
         # Example: Trigger a CI/CD webhook (replace URL with your actual endpoint)
         cicd_url = os.environ.get("CICD_WEBHOOK_URL")
         if cicd_url:
             try:
-                response = requests.post(cicd_url)
+                response = http_session.post(cicd_url, timeout=WEBHOOK_TIMEOUT)
                 if response.status_code == 200:
                     logging.info("CI/CD workflow triggered via webhook.")
                     return True
@@ -86,7 +87,10 @@ class CICDTool:
             return True
 
 class NotificationTool:
-    def send_notification(self, message):
+    async def send_notification(self, message):
+        return await asyncio.to_thread(self._send_notification, message)
+
+    def _send_notification(self, message):
         # Example: Send notification to Telegram (extend for Discord, Slack, etc.)
         telegram_token = os.environ.get("TELEGRAM_BOT_TOKEN")
         telegram_chat_id = os.environ.get("TELEGRAM_CHAT_ID")
@@ -94,7 +98,7 @@ class NotificationTool:
             url = f"https://api.telegram.org/bot{telegram_token}/sendMessage"
             data = {"chat_id": telegram_chat_id, "text": message}
             try:
-                response = requests.post(url, data=data)
+                response = http_session.post(url, data=data, timeout=WEBHOOK_TIMEOUT)
                 if response.status_code == 200:
                     logging.info("Notification sent via Telegram.")
                     return True
@@ -117,39 +121,44 @@ class DeploymentAgent(AgentBase):
         self.cicd_tool = CICDTool()
         self.notification_tool = NotificationTool()
 
+    @staticmethod
+    def _zip_workspace(workspace_path, zip_path):
+        # Fast deflate level: the artifact is mostly source text and is recompressed downstream
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            for entry in iter_files(workspace_path):
+                zf.write(entry.path, os.path.relpath(entry.path, workspace_path))
+
     async def execute_task(self, task: str, workspace_path: str = None, commit_message: str = "Auto-commit by DeploymentAgent"):
         self.log(f"🚀 DeploymentAgent received task: {task}")
-        import os
-        import shutil
         if not workspace_path:
-            workspace_path = os.path.join(os.getcwd(), "workspace", task.replace(" ", "_"))
+            workspace_path = get_workspace_path(task)
         if not os.path.exists(workspace_path):
             self.log(f"❌ Workspace folder does not exist: {workspace_path}")
             return f"Workspace folder does not exist: {workspace_path}"
         # 1. Zip the workspace folder for deployment artifact
         zip_path = workspace_path + ".zip"
-        shutil.make_archive(workspace_path, 'zip', workspace_path)
+        await asyncio.to_thread(self._zip_workspace, workspace_path, zip_path)
         self.log(f"📦 Zipped workspace folder at: {zip_path}")
         # 2. GitHub commit & push (from workspace folder)
         self.github_tool.repo_path = workspace_path
-        if not self.github_tool.git_add_commit_push(commit_message):
-            self.notification_tool.send_notification("❌ GitHub push failed.")
+        if not await asyncio.to_thread(self.github_tool.git_add_commit_push, commit_message):
+            await self.notification_tool.send_notification("❌ GitHub push failed.")
             return "GitHub push failed. Aborting deployment."
         self.log("✅ Code pushed to GitHub.")
-        # 3. Trigger deployment
-        if not self.deployment_tool.trigger_deployment():
-            self.notification_tool.send_notification("❌ Deployment failed.")
+        # 3. Trigger deployment and CI/CD concurrently (independent webhooks)
+        deploy_ok, cicd_ok = await asyncio.gather(
+            self.deployment_tool.trigger_deployment(),
+            self.cicd_tool.trigger_cicd()
+        )
+        if not deploy_ok:
+            await self.notification_tool.send_notification("❌ Deployment failed.")
             return "Deployment failed."
         self.log("✅ Deployment pipeline triggered.")
-        # 4. Trigger CI/CD
-        if not self.cicd_tool.trigger_cicd():
-            self.notification_tool.send_notification("❌ CI/CD failed.")
+        if not cicd_ok:
+            await self.notification_tool.send_notification("❌ CI/CD failed.")
             return "CI/CD failed."
         self.log("✅ CI/CD workflow triggered.")
-        # 5. Notify success
-        self.notification_tool.send_notification(f"✅ Deployment complete for task: {task}")
-        return f"Deployment complete for task: {task}"
-        # 4. Send notification
-        self.notification_tool.send_notification("🎉 Deployment and CI/CD successful!")
+        # 4. Notify success (single message covering deployment and CI/CD)
+        await self.notification_tool.send_notification(f"✅ Deployment and CI/CD complete for task: {task}")
         self.log("🎉 All actions completed and notifications sent.")
-        return "Deployment, CI/CD, and notifications completed."
\ No newline at end of file
+        return f"Deployment complete for task: {task}"
\ No newline at end of file
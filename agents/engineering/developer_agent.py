@@ -1,42 +1,28 @@
 # agents/engineering/developer_agent.py
 
 from agents.agent_base import AgentBase
+from agents.project_history import ProjectHistoryMixin
 from config.company_profile import company_profile
-from utils.llm_planner import call_llm
+from utils.llm_cache import acached_call_llm
+from utils.prompt_utils import clip
 import asyncio
 import os
+import re
+from typing import List, NamedTuple, Optional
 
-class DeveloperAgent(AgentBase):
-    """Developer Agent - handles software development tasks"""
-    
-    def __init__(self, name="Developer Agent", department="engineering", role="Software Developer", memory=None, memory_manager=None, research_agent=None):
-        super().__init__(name, department, role, memory, memory_manager, research_agent)
-        self.projects = []
-        
-    async def execute_task(self, task: str):
-        """Execute development task with Indian tech landscape considerations"""
-        self.log(f"💻 Development task received: {task}")
-        
-        # Get company context
-        company_context = self.get_company_context()
-        
-        # Request technical research
-        research_query = f"Development research for Indian market: {task}"
-        research_data = await self.request_research(research_query)
-        
-        # Execute development task
-        dev_prompt = f"""
-You are a software developer for {company_context['company_name']} in the {company_context['sector']} sector.
+# Prompt scaffolds: the company-specific part is rendered once per profile change and the
+# per-call task text is appended last, so every request shares an identical prompt prefix
+_DEV_HEADER_TMPL = """
+You are a software developer for {company_name} in the {sector} sector.
 
 Company Details:
-- Description: {company_context['description']}
-- Target Market: {company_context['target_location']}
-- Budget: {company_context['budget']} {company_context['currency']}
-- Goal: {company_context['goal']}
-
-Development Task: {task}
-Technical Research: {research_data}
+- Description: {description}
+- Target Market: {target_location}
+- Budget: {budget} {currency}
+- Goal: {goal}
+"""
 
+_DEV_CHECKLIST = """
 Develop solution considering:
 1. Mobile-first approach (high smartphone usage in India)
 2. Low bandwidth optimization (varying internet speeds)
@@ -51,60 +37,12 @@ Develop solution considering:
 
 Provide detailed technical implementation plan with code architecture, technology choices, and deployment strategy.
 """
-        
-        result = call_llm(dev_prompt)
-        
-        # Fallback if LLM fails
-        if "Error:" in result or "failed" in result.lower():
-            result = f"""
-Development Solution for: {task}
 
-Technical Architecture:
-1. Platform: Android-first development (90% Indian market share)
-2. Technology Stack: React Native for cross-platform compatibility
-3. Backend: Node.js with MongoDB for scalability
-4. Payment Integration: UPI, Razorpay, Paytm integration
-5. Language Support: Hindi, English, and regional languages
-6. Offline Capability: Local data storage and sync
-7. Performance: Optimized for 2G/3G networks and budget devices
-8. Security: End-to-end encryption and Indian compliance
+_MOBILE_TMPL = """
+Develop mobile application for {company_name}:
 
-Development Timeline: 12-16 weeks
-Resource Requirements: 4-6 developers, 2 QA engineers
-Budget Estimate: 60-70% of allocated {company_context['budget']} {company_context['currency']}
-
-Deployment Strategy: Phased rollout starting with tier-1 cities
-"""
-        
-        # Store project information
-        self.projects.append({
-            'task': task,
-            'result': result,
-            'timestamp': self.created_at,
-            'status': 'completed'
-        })
-        
-        self.save_to_memory(task, result)
-        self.log("✅ Development task completed")
-        
-        return f"💻 Development Solution: {result}"
-        
-    async def create_mobile_app(self, app_requirements: str):
-        """Create mobile application for Indian market"""
-        self.log(f"📱 Creating mobile app: {app_requirements}")
-        
-        company_context = self.get_company_context()
-        
-        # Get mobile development research
-        mobile_research = await self.request_research(f"Mobile app development for India: {app_requirements}")
-        
-        mobile_prompt = f"""
-Develop mobile application for {company_context['company_name']}:
-
-App Requirements: {app_requirements}
-Research Data: {mobile_research}
-Target Market: {company_context['target_location']}
-Budget: {company_context['budget']} {company_context['currency']}
+Target Market: {target_location}
+Budget: {budget} {currency}
 
 Create mobile app solution covering:
 1. Platform choice (Android priority for Indian market)
@@ -120,28 +58,12 @@ Create mobile app solution covering:
 
 Provide detailed technical architecture, development timeline, and resource requirements.
 """
-        
-        app_solution = call_llm(mobile_prompt)
-        self.save_to_memory(f"Mobile App: {app_requirements}", app_solution)
-        
-        return f"📱 Mobile App Solution: {app_solution}"
-        
-    async def develop_web_application(self, web_requirements: str):
-        """Develop web application optimized for Indian users"""
-        self.log(f"🌐 Developing web application: {web_requirements}")
-        
-        company_context = self.get_company_context()
-        
-        # Get web development research
-        web_research = await self.request_research(f"Web development for Indian market: {web_requirements}")
-        
-        web_prompt = f"""
-Develop web application for {company_context['company_name']}:
 
-Web Requirements: {web_requirements}
-Research Data: {web_research}
-Target Market: {company_context['target_location']}
-Budget: {company_context['budget']} {company_context['currency']}
+_WEB_TMPL = """
+Develop web application for {company_name}:
+
+Target Market: {target_location}
+Budget: {budget} {currency}
 
 Create web solution covering:
 1. Responsive design for mobile-first approach
@@ -157,27 +79,11 @@ Create web solution covering:
 
 Provide technical architecture, technology stack, and implementation roadmap.
 """
-        
-        web_solution = call_llm(web_prompt)
-        self.save_to_memory(f"Web App: {web_requirements}", web_solution)
-        
-        return f"🌐 Web Application Solution: {web_solution}"
-        
-    async def implement_api_integration(self, integration_requirements: str):
-        """Implement API integrations for Indian services"""
-        self.log(f"🔌 Implementing API integration: {integration_requirements}")
-        
-        company_context = self.get_company_context()
-        
-        # Get API integration research
-        api_research = await self.request_research(f"API integration for Indian services: {integration_requirements}")
-        
-        api_prompt = f"""
-Implement API integration for {company_context['company_name']}:
 
-Integration Requirements: {integration_requirements}
-Research Data: {api_research}
-Company Sector: {company_context['sector']}
+_API_TMPL = """
+Implement API integration for {company_name}:
+
+Company Sector: {sector}
 
 Implement integration covering:
 1. Popular Indian payment gateways (Razorpay, Paytm, UPI)
@@ -193,23 +99,11 @@ Implement integration covering:
 
 Provide detailed integration architecture, code examples, and testing strategy.
 """
-        
-        integration_solution = call_llm(api_prompt)
-        self.save_to_memory(f"API Integration: {integration_requirements}", integration_solution)
-        
-        return f"🔌 API Integration Solution: {integration_solution}"
-        
-    async def optimize_performance(self, performance_requirements: str):
-        """Optimize application performance for Indian infrastructure"""
-        self.log(f"⚡ Optimizing performance: {performance_requirements}")
-        
-        company_context = self.get_company_context()
-        
-        perf_prompt = f"""
-Optimize application performance for {company_context['company_name']}:
 
-Performance Requirements: {performance_requirements}
-Target Market: {company_context['target_location']}
+_PERF_TMPL = """
+Optimize application performance for {company_name}:
+
+Target Market: {target_location}
 
 Optimize for Indian infrastructure:
 1. Network optimization for varying connection speeds
@@ -225,16 +119,123 @@ Optimize for Indian infrastructure:
 
 Provide specific optimization techniques, tools, and implementation guidelines.
 """
+
+# LLM failure markers, matched case-insensitively without lowercasing the whole response
+_FAIL_RE = re.compile(r"error:|failed", re.I)
+
+# Returned instead of the LLM response when the call failed
+_DEV_FALLBACK_TMPL = """
+Development Solution for: {task}
+
+Technical Architecture:
+1. Platform: Android-first development (90% Indian market share)
+2. Technology Stack: React Native for cross-platform compatibility
+3. Backend: Node.js with MongoDB for scalability
+4. Payment Integration: UPI, Razorpay, Paytm integration
+5. Language Support: Hindi, English, and regional languages
+6. Offline Capability: Local data storage and sync
+7. Performance: Optimized for 2G/3G networks and budget devices
+8. Security: End-to-end encryption and Indian compliance
+
+Development Timeline: 12-16 weeks
+Resource Requirements: 4-6 developers, 2 QA engineers
+Budget Estimate: 60-70% of allocated {budget} {currency}
+
+Deployment Strategy: Phased rollout starting with tier-1 cities
+"""
+
+class _PromptSpec(NamedTuple):
+    log_message: str                 # Logged with the request when the task starts
+    research_query: Optional[str]    # Research request for the task, if any ({request})
+    template: str                    # Company-specific scaffold rendered by company_profile
+    inputs: str                      # Per-call suffix ({request}, {research})
+    memory_label: Optional[str]      # Memory key prefix; "dev" results are stored under the bare task
+    result_label: str                # Prefix of the returned solution
+
+# Developer task kinds: each is research (optional) -> prompt -> LLM -> memory
+_PROMPTS = {
+    "dev": _PromptSpec(
+        "💻 Development task received", "Development research for Indian market: {request}",
+        _DEV_HEADER_TMPL + _DEV_CHECKLIST, "\nDevelopment Task: {request}\nTechnical Research: {research}\n",
+        None, "💻 Development Solution"),
+    "mobile": _PromptSpec(
+        "📱 Creating mobile app", "Mobile app development for India: {request}",
+        _MOBILE_TMPL, "\nApp Requirements: {request}\nResearch Data: {research}\n",
+        "Mobile App", "📱 Mobile App Solution"),
+    "web": _PromptSpec(
+        "🌐 Developing web application", "Web development for Indian market: {request}",
+        _WEB_TMPL, "\nWeb Requirements: {request}\nResearch Data: {research}\n",
+        "Web App", "🌐 Web Application Solution"),
+    "api": _PromptSpec(
+        "🔌 Implementing API integration", "API integration for Indian services: {request}",
+        _API_TMPL, "\nIntegration Requirements: {request}\nResearch Data: {research}\n",
+        "API Integration", "🔌 API Integration Solution"),
+    "perf": _PromptSpec(
+        "⚡ Optimizing performance", None,
+        _PERF_TMPL, "\nPerformance Requirements: {request}\n",
+        "Performance Optimization", "⚡ Performance Optimization"),
+}
+
+class DeveloperAgent(ProjectHistoryMixin, AgentBase):
+    """Developer Agent - handles software development tasks"""
+    
+    def __init__(self, name="Developer Agent", department="engineering", role="Software Developer", memory=None, memory_manager=None, research_agent=None):
+        super().__init__(name, department, role, memory, memory_manager, research_agent)
+        
+    async def execute_task(self, task: str):
+        """Execute development task with Indian tech landscape considerations"""
+        result = await self._generate("dev", task)
+        return self._complete_dev_task(task, result)
+        
+    async def execute_multi(self, tasks: List[str]):
+        """Execute several independent development tasks concurrently"""
+        results = await asyncio.gather(*(self._generate("dev", task) for task in tasks))
+        return [self._complete_dev_task(task, result) for task, result in zip(tasks, results)]
+        
+    async def create_mobile_app(self, app_requirements: str):
+        """Create mobile application for Indian market"""
+        return await self._run("mobile", app_requirements)
+        
+    async def develop_web_application(self, web_requirements: str):
+        """Develop web application optimized for Indian users"""
+        return await self._run("web", web_requirements)
+        
+    async def implement_api_integration(self, integration_requirements: str):
+        """Implement API integrations for Indian services"""
+        return await self._run("api", integration_requirements)
+        
+    async def optimize_performance(self, performance_requirements: str):
+        """Optimize application performance for Indian infrastructure"""
+        return await self._run("perf", performance_requirements)
         
-        optimization = call_llm(perf_prompt)
-        self.save_to_memory(f"Performance Optimization: {performance_requirements}", optimization)
+    async def _generate(self, kind: str, request: str) -> str:
+        """Research (if the kind needs it), render the prompt and call the LLM"""
+        spec = _PROMPTS[kind]
+        self.log(f"{spec.log_message}: {request}")
         
-        return f"⚡ Performance Optimization: {optimization}"
+        research = None
+        if spec.research_query:
+            research = clip(await self.request_research(spec.research_query.format(request=request)))
+        
+        prompt = company_profile.render(spec.template) + spec.inputs.format(request=request, research=research)
+        return await acached_call_llm(prompt, scope=f"developer.{kind}")
+        
+    async def _run(self, kind: str, request: str) -> str:
+        """Generate a solution for a task kind, store it and label it"""
+        spec = _PROMPTS[kind]
+        solution = await self._generate(kind, request)
+        self.save_to_memory_async(f"{spec.memory_label}: {request}", solution)
+        return f"{spec.result_label}: {solution}"
+        
+    def _complete_dev_task(self, task: str, result: str) -> str:
+        """Apply the fallback if the LLM failed, then record and store the result"""
+        if _FAIL_RE.search(result):
+            result = _DEV_FALLBACK_TMPL.format(task=task, **self.company_context)
+        
+        # Store project information
+        self._record_project(task, result, 'completed')
+        
+        self.save_to_memory_async(task, result)
+        self.log("✅ Development task completed")
         
-    async def get_project_status(self):
-        """Get development project status"""
-        return {
-            'total_projects': len(self.projects),
-            'completed_projects': len([p for p in self.projects if p['status'] == 'completed']),
-            'projects': self.projects
-        }
\ No newline at end of file
+        return f"{_PROMPTS['dev'].result_label}: {result}"
\ No newline at end of file
@@ -1,23 +1,32 @@
 from agents.agent_base import AgentBase
 import asyncio
 import os
-from dotenv import load_dotenv
-load_dotenv()
-from langchain_groq import ChatGroq
-from langchain.schema.messages import HumanMessage
+import re
+from utils.llm_cache import acached_chat
+from utils.groq_client import GROQ_API_KEY, get_groq_client
+
+# Used when no Groq client is configured
+_FALLBACK_STRATEGY_PLAN = """Plan for: {task}
+1. Clarify scope and owners with the team
+2. Break the work into tasks and assign them
+3. Track progress and unblock the team daily
+4. Review results with QA before any deployment"""
+
+# Routing keywords, matched as case-insensitive substrings in one pass over the task
+_ROUTER = re.compile(r"developer|qa|devops|deployment approved|ready for deployment", re.I)
 
 class EngineeringManagerAgent(AgentBase):
     def __init__(self, name="Engineering Manager", department="engineering", role="Team Lead", memory=None, memory_manager=None, workspace_folder=None):
         super().__init__(name, department, role, memory, memory_manager)
         self.workspace_folder = workspace_folder
-        api_key = os.getenv('GROQ_API_KEY') or os.getenv('GROQ_API_KEY_1') or os.getenv('GROQ_API_KEY_2')
+        api_key = GROQ_API_KEY
         model_name = os.getenv('MODEL_NAME', 'llama3-8b-8192')
         if not api_key:
             self.log("⚠️ Warning: No GROQ_API_KEY environment variables found - running in limited mode")
             self.llm = None
         else:
             try:
-                self.llm = ChatGroq(temperature=0.4, model_name=model_name, api_key=api_key)
+                self.llm = get_groq_client(0.4, model_name, api_key)
             except Exception as e:
                 self.log(f"⚠️ Error initializing Groq client: {str(e)}")
                 self.llm = None
@@ -31,20 +40,28 @@ class EngineeringManagerAgent(AgentBase):
 
         # Ask Groq to analyze the engineering task or team load
         prompt = f"""You are an engineering manager. Based on the following situation or task, plan what to do:\n\n'{task}'"""
-        response = self.llm([HumanMessage(content=prompt)]).content.strip()
-
-        self.log(f"📋 Strategy Plan:\n{response}")
+        if self.llm is None:
+            response = _FALLBACK_STRATEGY_PLAN.format(task=task)
+            self.log(f"📋 Strategy Plan (fallback, no LLM configured):\n{response}")
+        else:
+            stream = self.log_stream("📋 Strategy Plan:")
+            response = await acached_chat(self.llm, prompt, scope="engineering_manager.plan", on_chunk=stream.write)
+            stream.close(response)
         self.save_to_memory(task, response)
 
         # Optionally communicate with Developer
-        if "developer" in task.lower():
-            self.send_message_to("DeveloperAgent", f"Priority update: {task}")
-        elif "qa" in task.lower():
-            self.send_message_to("QAAgent", f"Please reverify: {task}")
-        elif "devops" in task.lower():
-            self.send_message_to("DevOpsAgent", f"Prepare rollback plan for: {task}")
+        hits = {match.group(0).lower() for match in _ROUTER.finditer(task)}
+        messages = []
+        if "developer" in hits:
+            messages.append(("DeveloperAgent", f"Priority update: {task}"))
+        elif "qa" in hits:
+            messages.append(("QAAgent", f"Please reverify: {task}"))
+        elif "devops" in hits:
+            messages.append(("DevOpsAgent", f"Prepare rollback plan for: {task}"))
         # After code reviewer and manager approval, delegate deployment
-        if "deployment approved" in task.lower() or "ready for deployment" in task.lower():
-            self.send_message_to("DeploymentAgent", f"Deploy: {task}")
+        if "deployment approved" in hits or "ready for deployment" in hits:
+            messages.append(("DeploymentAgent", f"Deploy: {task}"))
+        if messages:
+            self.dispatch_messages(*messages)
 
         return "Engineering plan processed and delegated."
\ No newline at end of file
@@ -1,33 +1,46 @@
 from agents.agent_base import AgentBase
+from agents.engineering.workspace import get_workspace_path
 import asyncio
+import os
+import re
+
+_FAIL_RE = re.compile("fail", re.I)  # Case-insensitive without lowercasing the whole task
 
 class QAAgent(AgentBase):
     def __init__(self, name="QAAgent", department="engineering", role="Tester", memory=None, memory_manager=None, workspace_folder=None):
         super().__init__(name, department, role, memory, memory_manager)
         self.workspace_folder = workspace_folder
+        self._path_cache = {}  # (task, workspace_path) -> test log file, its directory already created
     async def execute_task(self, task: str, workspace_path: str = None):
         self.log(f"Received QA task: {task}")
-        import os
-        if not workspace_path:
-            workspace_path = os.path.join(os.getcwd(), "workspace", task.replace(" ", "_"))
-        tests_dir = os.path.join(workspace_path, "tests")
-        os.makedirs(tests_dir, exist_ok=True)
+        key = (task, workspace_path)
+        log_file = self._path_cache.get(key)
+        if log_file is None:
+            tests_dir = os.path.join(workspace_path or get_workspace_path(task), "tests")
+            await asyncio.to_thread(os.makedirs, tests_dir, exist_ok=True)
+            log_file = self._path_cache[key] = os.path.join(tests_dir, "test_log.txt")
         # Simulate test execution delay
         await asyncio.sleep(1)
-        if "fail" in task.lower():
+        if _FAIL_RE.search(task):
             result = "❌ Tests failed. Bug report generated."
             self.log(result)
-            self.send_message_to("DeveloperAgent", "Tests failed. Please fix the issues.")
-            log_file = os.path.join(tests_dir, "test_log.txt")
-            with open(log_file, "w") as f:
-                f.write(result)
+            notification = ("DeveloperAgent", "Tests failed. Please fix the issues.")
         else:
             result = "✅ All tests passed. Build is ready for deployment."
             self.log(result)
-            self.send_message_to("DevOpsAgent", "Tests passed. Proceed to deployment.")
-            log_file = os.path.join(tests_dir, "test_log.txt")
-            with open(log_file, "w") as f:
-                f.write(result)
+            notification = ("DevOpsAgent", "Tests passed. Proceed to deployment.")
+        self.dispatch_messages(notification, ("EngineeringManagerAgent", f"QA Result for '{task}': {result}"))
+        await asyncio.to_thread(self._write_log, log_file, result)
         self.save_to_memory(task, result)
-        self.send_message_to("EngineeringManagerAgent", f"QA Result for '{task}': {result}")
-        return result
\ No newline at end of file
+        return result
+
+    @staticmethod
+    def _write_log(log_file: str, result: str):
+        try:
+            f = open(log_file, "w")
+        except FileNotFoundError:
+            # Workspace was cleaned up since the path was cached
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            f = open(log_file, "w")
+        with f:
+            f.write(result)
@@ -1,50 +1,22 @@
 # agents/engineering/tech_lead_agent.py
 
 from agents.agent_base import AgentBase
+from agents.project_history import ProjectHistoryMixin
 from config.company_profile import company_profile
-from utils.llm_planner import call_llm
+from utils.llm_cache import acached_call_llm
+from utils.prompt_utils import clip
 import asyncio
 
-class TechLeadAgent(AgentBase):
-    """Tech Lead Agent - Technical leadership and coordination"""
-    
-    def __init__(self, name="Tech Lead", department="engineering", role="Technical Lead", memory=None, memory_manager=None, research_agent=None, communicator=None, message_event=None):
-        super().__init__(name, department, role, memory, memory_manager, research_agent)
-        self.communicator = communicator
-        self.message_sent_event = message_event
-        self.projects = []
-        
-    def receive_message(self, sender_name, message):
-        """Receive message from other agents"""
-        self.log(f"📥 Received message from {sender_name}: {message}")
-        
-        # Process the message and respond
-        if "marketing" in sender_name.lower():
-            self.log("🔄 Processing marketing requirements...")
-            
-    async def execute_task(self, task: str):
-        """Execute technical leadership task"""
-        self.log(f"⚙️ Tech Lead task received: {task}")
-        
-        # Get company context
-        company_context = self.get_company_context()
-        
-        # Request technical research
-        research_query = f"Technical leadership research: {task}"
-        research_data = await self.request_research(research_query)
-        
-        # Execute technical leadership task
-        tech_lead_prompt = f"""
-You are the Technical Lead for {company_context['company_name']} in the {company_context['sector']} sector.
+# Prompt scaffolds: the company-specific part is rendered once per profile change and the
+# per-call inputs are appended last, so every request shares an identical prompt prefix
+_TECH_LEAD_TMPL = """
+You are the Technical Lead for {company_name} in the {sector} sector.
 
 Company Details:
-- Description: {company_context['description']}
-- Target Market: {company_context['target_location']}
-- Budget: {company_context['budget']} {company_context['currency']}
-- Goal: {company_context['goal']}
-
-Task: {task}
-Research Data: {research_data}
+- Description: {description}
+- Target Market: {target_location}
+- Budget: {budget} {currency}
+- Goal: {goal}
 
 As Technical Lead, provide leadership covering:
 1. Technical architecture and design decisions
@@ -60,44 +32,13 @@ As Technical Lead, provide leadership covering:
 
 Provide detailed technical leadership plan and next steps.
 """
-        
-        result = call_llm(tech_lead_prompt)
-        
-        # If communicator is available, send response
-        if self.communicator and "marketing" in task.lower():
-            response_message = f"[Tech Integration] Technical requirements analyzed: {result[:200]}..."
-            self.communicator.send_message(self.name, "Marketing", response_message)
-            
-            # Signal that message was sent
-            if self.message_sent_event:
-                self.message_sent_event.set()
-        
-        # Store project information
-        self.projects.append({
-            'task': task,
-            'result': result,
-            'timestamp': self.created_at,
-            'status': 'completed'
-        })
-        
-        self.save_to_memory(task, result)
-        self.log("✅ Technical leadership task completed")
-        
-        return f"⚙️ Tech Lead Solution: {result}"
-        
-    async def review_technical_requirements(self, requirements: str):
-        """Review and analyze technical requirements"""
-        self.log(f"🔍 Reviewing technical requirements: {requirements}")
-        
-        company_context = self.get_company_context()
-        
-        review_prompt = f"""
-As Technical Lead, review these technical requirements for {company_context['company_name']}:
 
-Requirements: {requirements}
-Company Sector: {company_context['sector']}
-Target Market: {company_context['target_location']}
-Budget: {company_context['budget']} {company_context['currency']}
+_REQUIREMENTS_REVIEW_TMPL = """
+As Technical Lead, review these technical requirements for {company_name}:
+
+Company Sector: {sector}
+Target Market: {target_location}
+Budget: {budget} {currency}
 
 Provide technical review covering:
 1. Feasibility analysis
@@ -113,24 +54,12 @@ Provide technical review covering:
 
 Focus on Indian market technical landscape and constraints.
 """
-        
-        review = call_llm(review_prompt)
-        self.save_to_memory(f"Technical Review: {requirements}", review)
-        
-        return f"🔍 Technical Review: {review}"
-        
-    async def plan_development_sprint(self, sprint_goals: str):
-        """Plan development sprint with team coordination"""
-        self.log(f"📅 Planning development sprint: {sprint_goals}")
-        
-        company_context = self.get_company_context()
-        
-        sprint_prompt = f"""
-As Technical Lead, plan development sprint for {company_context['company_name']}:
 
-Sprint Goals: {sprint_goals}
-Company Context: {company_context['description']}
-Target Market: {company_context['target_location']}
+_SPRINT_TMPL = """
+As Technical Lead, plan development sprint for {company_name}:
+
+Company Context: {description}
+Target Market: {target_location}
 
 Plan sprint covering:
 1. Sprint objectives and deliverables
@@ -146,20 +75,9 @@ Plan sprint covering:
 
 Consider Indian development team dynamics and work culture.
 """
-        
-        sprint_plan = call_llm(sprint_prompt)
-        self.save_to_memory(f"Sprint Plan: {sprint_goals}", sprint_plan)
-        
-        return f"📅 Sprint Plan: {sprint_plan}"
-        
-    async def conduct_technical_review(self, code_or_design: str):
-        """Conduct technical review of code or design"""
-        self.log(f"👨‍💻 Conducting technical review: {code_or_design}")
-        
-        review_prompt = f"""
-As Technical Lead, conduct thorough technical review:
 
-Subject: {code_or_design}
+_TECHNICAL_REVIEW_TMPL = """
+As Technical Lead, conduct thorough technical review:
 
 Review criteria:
 1. Code quality and best practices
@@ -175,16 +93,92 @@ Review criteria:
 
 Provide detailed feedback with specific recommendations for improvement.
 """
+
+class TechLeadAgent(ProjectHistoryMixin, AgentBase):
+    """Tech Lead Agent - Technical leadership and coordination"""
+    
+    def __init__(self, name="Tech Lead", department="engineering", role="Technical Lead", memory=None, memory_manager=None, research_agent=None, communicator=None, message_event=None):
+        super().__init__(name, department, role, memory, memory_manager, research_agent)
+        self.communicator = communicator
+        self.message_sent_event = message_event
+        
+    def receive_message(self, sender_name, message):
+        """Receive message from other agents"""
+        self.log(f"📥 Received message from {sender_name}: {message}")
+        
+        # Process the message and respond
+        if "marketing" in sender_name.lower():
+            self.log("🔄 Processing marketing requirements...")
+            
+    async def execute_task(self, task: str):
+        """Execute technical leadership task"""
+        self.log(f"⚙️ Tech Lead task received: {task}")
+        
+        # Request technical research
+        research_query = f"Technical leadership research: {task}"
+        research_data = await self.request_research(research_query)
+        
+        # Execute technical leadership task
+        tech_lead_prompt = company_profile.render(_TECH_LEAD_TMPL) + f"\nTask: {task}\nResearch Data: {clip(research_data)}\n"
+        
+        result = await acached_call_llm(tech_lead_prompt, scope="tech_lead.execute_task")
+        
+        # If communicator is available, send response
+        if self.communicator and "marketing" in task.lower():
+            response_message = f"[Tech Integration] Technical requirements analyzed: {result[:200]}..."
+            self.communicator.send_message(self.name, "Marketing", response_message)
+            
+            # Signal that message was sent
+            if self.message_sent_event:
+                self.message_sent_event.set()
+        
+        # Store project information
+        self._record_project(task, result, 'completed')
+        
+        self.save_to_memory_async(task, result)
+        self.log("✅ Technical leadership task completed")
+        
+        return f"⚙️ Tech Lead Solution: {result}"
+        
+    async def review_technical_requirements(self, requirements: str):
+        """Review and analyze technical requirements"""
+        self.log(f"🔍 Reviewing technical requirements: {requirements}")
+        
+        review_prompt = company_profile.render(_REQUIREMENTS_REVIEW_TMPL) + f"\nRequirements: {requirements}\n"
+        
+        review = await acached_call_llm(review_prompt, scope="tech_lead.requirements_review")
+        self.save_to_memory_async(f"Technical Review: {requirements}", review)
+        
+        return f"🔍 Technical Review: {review}"
+        
+    async def plan_development_sprint(self, sprint_goals: str, requirements: str = None, code_or_design: str = None):
+        """Plan development sprint with team coordination, reviewing its requirements and design concurrently"""
+        self.log(f"📅 Planning development sprint: {sprint_goals}")
+        
+        sprint_prompt = company_profile.render(_SPRINT_TMPL) + f"\nSprint Goals: {sprint_goals}\n"
+        
+        # Independent reviews for the same sprint are dispatched alongside the plan
+        reviews = []
+        if requirements:
+            reviews.append(self.review_technical_requirements(requirements))
+        if code_or_design:
+            reviews.append(self.conduct_technical_review(code_or_design))
+        
+        sprint_plan, *review_results = await asyncio.gather(
+            acached_call_llm(sprint_prompt, scope="tech_lead.sprint_plan"),
+            *reviews
+        )
+        self.save_to_memory_async(f"Sprint Plan: {sprint_goals}", sprint_plan)
+        
+        return "\n\n".join([f"📅 Sprint Plan: {sprint_plan}", *review_results])
+        
+    async def conduct_technical_review(self, code_or_design: str):
+        """Conduct technical review of code or design"""
+        self.log(f"👨‍💻 Conducting technical review: {code_or_design}")
         
-        review_result = call_llm(review_prompt)
-        self.save_to_memory(f"Technical Review: {code_or_design}", review_result)
+        review_prompt = _TECHNICAL_REVIEW_TMPL + f"\nSubject: {code_or_design}\n"
         
-        return f"👨‍💻 Technical Review: {review_result}"
+        review_result = await acached_call_llm(review_prompt, scope="tech_lead.technical_review")
+        self.save_to_memory_async(f"Technical Review: {code_or_design}", review_result)
         
-    async def get_project_status(self):
-        """Get technical project status"""
-        return {
-            'total_projects': len(self.projects),
-            'completed_projects': len([p for p in self.projects if p['status'] == 'completed']),
-            'projects': self.projects
-        }
\ No newline at end of file
+        return f"👨‍💻 Technical Review: {review_result}"
\ No newline at end of file
@@ -0,0 +1,12 @@
+# agents/engineering/workspace.py
+
+import os
+
+# Resolved once at import; engineering agents keep per-task workspaces under it
+WORKSPACE_ROOT = os.path.join(os.getcwd(), "workspace")
+_SPACE_TO_UNDERSCORE = str.maketrans({" ": "_"})
+
+
+def get_workspace_path(task: str) -> str:
+    """Get the workspace folder for a task (spaces in the task become underscores)"""
+    return os.path.join(WORKSPACE_ROOT, task.translate(_SPACE_TO_UNDERSCORE))
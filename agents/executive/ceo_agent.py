@@ -2,9 +2,61 @@
 
 from agents.agent_base import AgentBase
 from config.company_profile import company_profile
-from utils.llm_planner import call_llm
+from utils.llm_cache import acached_call_llm
+from utils.prompt_utils import clip
 from engine.workflow_manager import Task, ExecutionPhase
+from engine.async_processor import AsyncProcessor
+from functools import lru_cache
+from typing import AsyncIterator, Iterator
 import asyncio
+import re
+
+# Department routing keywords, matched as substrings (e.g. 'market' also hits 'marketing')
+_MARKETING_RE = re.compile(r"marketing|campaign|promotion|brand|social|content|diwali|festival", re.I)
+_ENGINEERING_RE = re.compile(r"develop|app|platform|software|code|technical|system|upi|payment|e-commerce|mobile", re.I)
+_RESEARCH_RE = re.compile(r"research|analysis|competitor|market|study", re.I)
+
+# Tasks that warrant market research before the strategic analysis
+_STRATEGIC_RESEARCH_RE = re.compile(r"market|launch|competition", re.I)
+
+# Status polls are low priority background jobs
+STATUS_POLL_PRIORITY = 8
+
+# One "Field: value" line of an LLM task breakdown, found anywhere in the text in a single scan
+_BREAKDOWN_FIELD_RE = re.compile(r"^\s*(Department|Task|Phase|Priority|Dependencies):(.*)$", re.M)
+
+# Prompt scaffolds: the system message is the shared company preamble plus these fixed
+# instructions, so every request shares one cacheable prefix; per-call inputs go in the user message
+_STRATEGIC_PROMPT = """
+You are the CEO of this company. Provide strategic analysis of the task below covering:
+1. Strategic importance and alignment with company goals
+2. Resource requirements and budget implications
+3. Risk assessment and mitigation strategies
+4. Timeline and priority level
+5. Success metrics and KPIs
+6. Stakeholder impact analysis
+7. Market positioning implications for Indian market
+
+Provide clear, actionable strategic insights.
+"""
+
+_DECISION_PROMPT = """
+You are the CEO of this company. Make a strategic decision on the context below and provide:
+1. Decision recommendation
+2. Rationale and supporting factors
+3. Resource allocation requirements
+4. Risk mitigation strategies
+5. Implementation timeline
+6. Success metrics
+
+Focus on Indian market dynamics and cultural considerations.
+"""
+
+@lru_cache(maxsize=8)
+def _default_department(sector: str) -> str:
+    """Department for tasks that match no routing keywords, based on company sector"""
+    sector = sector.lower()
+    return 'engineering' if 'tech' in sector or 'it' in sector else 'marketing'
 
 class CEOAgent(AgentBase):
     """CEO Agent - Central task router and strategic decision maker"""
@@ -14,28 +66,27 @@ class CEOAgent(AgentBase):
         self.workflow_manager = workflow_manager
         self.department_heads = {}
         self.task_counter = 0
+        # Deferrable work (status polls) runs here under a concurrency cap, behind interactive tasks
+        self.background = AsyncProcessor()
         
     def register_department_head(self, department: str, head_agent):
         """Register department head agents"""
         self.department_heads[department] = head_agent
-        self.log(f"✅ Registered {department} department head: {head_agent.name}")
+        self.log("✅ Registered %s department head: %s", department, head_agent.name)
         
     async def execute_task(self, task: str):
         """CEO processes and routes tasks through proper hierarchy"""
-        self.log(f"🎯 CEO received task: {task}")
+        self.log("🎯 CEO received task: %s", task)
         
         # Get company context for decision making
-        company_context = self.get_company_context()
+        company_context = self.company_context
         
         # Analyze task and create strategic plan
         strategic_analysis = await self._analyze_task_strategically(task, company_context)
         
-        # Break down task into department-specific subtasks
-        subtasks = await self._break_down_task(task, strategic_analysis)
-        
-        # Route tasks through workflow manager
-        if self.workflow_manager and subtasks:
-            await self._route_through_workflow(subtasks)
+        # Route department-specific subtasks through workflow manager as they are broken out
+        if self.workflow_manager:
+            await self._route_through_workflow(self._break_down_task(task, strategic_analysis))
             
         self.save_to_memory(task, f"Strategic analysis completed and tasks routed: {strategic_analysis}")
         return f"🎯 CEO: Strategic plan executed for '{task}'"
@@ -45,35 +96,15 @@ class CEOAgent(AgentBase):
         self.log("🧠 Conducting strategic analysis...")
         
         # Request market research if needed
-        if "market" in task.lower() or "launch" in task.lower() or "competition" in task.lower():
+        if _STRATEGIC_RESEARCH_RE.search(task):
             research_query = f"Strategic market analysis for: {task}"
             research_data = await self.request_research(research_query)
         else:
             research_data = "No additional research required"
         
-        strategic_prompt = f"""
-You are the CEO of {company_context['company_name']}, a {company_context['sector']} company in {company_context['target_location']}.
-Company Description: {company_context['description']}
-Budget: {company_context['budget']} {company_context['currency']}
-Goal: {company_context['goal']}
-
-Task to analyze: {task}
-
-Research Data: {research_data}
-
-As CEO, provide strategic analysis covering:
-1. Strategic importance and alignment with company goals
-2. Resource requirements and budget implications
-3. Risk assessment and mitigation strategies
-4. Timeline and priority level
-5. Success metrics and KPIs
-6. Stakeholder impact analysis
-7. Market positioning implications for Indian market
-
-Provide clear, actionable strategic insights.
-"""
+        strategic_prompt = f"Task to analyze: {task}\n\nResearch Data: {clip(research_data)}\n"
         
-        strategic_analysis = call_llm(strategic_prompt)
+        strategic_analysis = await acached_call_llm(strategic_prompt, system=company_profile.preamble() + _STRATEGIC_PROMPT, scope="ceo.strategic_analysis")
         
         # Fallback if LLM fails
         if "Error:" in strategic_analysis or "failed" in strategic_analysis.lower():
@@ -98,101 +129,95 @@ Recommendation: Proceed with task execution through appropriate departments.
         self.log("✅ Strategic analysis completed")
         return strategic_analysis
         
-    async def _break_down_task(self, original_task: str, strategic_analysis: str):
-        """Break down task into department-specific subtasks"""
+    async def _break_down_task(self, original_task: str, strategic_analysis: str) -> AsyncIterator[Task]:
+        """Break down task into department-specific subtasks, yielding each as soon as it is created"""
         self.log("📋 Breaking down task into department subtasks...")
         
         # Use rule-based task routing instead of LLM parsing to avoid API issues
-        subtasks = self._create_rule_based_subtasks(original_task)
+        created = 0
+        for subtask in self._create_rule_based_subtasks(original_task):
+            created += 1
+            yield subtask
         
-        self.log(f"📋 Created {len(subtasks)} department subtasks")
-        return subtasks
+        self.log("📋 Created %s department subtasks", created)
         
-    def _create_rule_based_subtasks(self, original_task: str):
+    def _create_rule_based_subtasks(self, original_task: str) -> Iterator[Task]:
         """Create subtasks based on task content and available departments"""
-        subtasks = []
-        task_lower = original_task.lower()
+        matched = False
         
         # Marketing tasks
-        if any(word in task_lower for word in ['marketing', 'campaign', 'promotion', 'brand', 'social', 'content', 'diwali', 'festival']):
-            subtasks.append(self._create_task_from_dict({
+        if _MARKETING_RE.search(original_task):
+            matched = True
+            yield self._create_task_from_dict({
                 'department': 'marketing',
                 'description': f"Execute marketing strategy for: {original_task}",
                 'phase': ExecutionPhase.PARALLEL,
                 'priority': 2,
                 'dependencies': []
-            }))
+            })
         
         # Engineering/Development tasks
-        if any(word in task_lower for word in ['develop', 'app', 'platform', 'software', 'code', 'technical', 'system', 'upi', 'payment', 'e-commerce', 'mobile']):
-            subtasks.append(self._create_task_from_dict({
+        if _ENGINEERING_RE.search(original_task):
+            matched = True
+            yield self._create_task_from_dict({
                 'department': 'engineering',
                 'description': f"Develop technical solution for: {original_task}",
                 'phase': ExecutionPhase.PARALLEL,
                 'priority': 1,
                 'dependencies': []
-            }))
+            })
         
         # Research tasks
-        if any(word in task_lower for word in ['research', 'analysis', 'competitor', 'market', 'study']):
-            subtasks.append(self._create_task_from_dict({
+        if _RESEARCH_RE.search(original_task):
+            matched = True
+            yield self._create_task_from_dict({
                 'department': 'research',
                 'description': f"Conduct research for: {original_task}",
                 'phase': ExecutionPhase.SEQUENTIAL,
                 'priority': 1,
                 'dependencies': []
-            }))
+            })
         
         # If no specific department identified, create a general strategic task
-        if not subtasks:
+        if not matched:
             # Route to the most appropriate department based on company sector
-            company_context = self.get_company_context()
-            if 'tech' in company_context['sector'].lower() or 'it' in company_context['sector'].lower():
-                dept = 'engineering'
-            else:
-                dept = 'marketing'
+            dept = _default_department(self.company_context['sector'])
                 
-            subtasks.append(self._create_task_from_dict({
+            yield self._create_task_from_dict({
                 'department': dept,
                 'description': f"Handle strategic task: {original_task}",
                 'phase': ExecutionPhase.PARALLEL,
                 'priority': 2,
                 'dependencies': []
-            }))
-        
-        return subtasks
+            })
         
     def _parse_task_breakdown(self, breakdown_text: str):
         """Parse LLM breakdown into structured Task objects"""
         subtasks = []
         current_task = {}
         
-        for line in breakdown_text.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.startswith('Department:'):
+        for match in _BREAKDOWN_FIELD_RE.finditer(breakdown_text):
+            field, value = match.group(1), match.group(2).strip()
+            
+            if field == 'Department':
                 if current_task:
                     subtasks.append(self._create_task_from_dict(current_task))
-                current_task = {'department': line.split(':', 1)[1].strip().lower()}
+                current_task = {'department': value.lower()}
                 
-            elif line.startswith('Task:'):
-                current_task['description'] = line.split(':', 1)[1].strip()
+            elif field == 'Task':
+                current_task['description'] = value
                 
-            elif line.startswith('Phase:'):
-                phase_str = line.split(':', 1)[1].strip().lower()
-                current_task['phase'] = ExecutionPhase.SEQUENTIAL if 'sequential' in phase_str else ExecutionPhase.PARALLEL
+            elif field == 'Phase':
+                current_task['phase'] = ExecutionPhase.SEQUENTIAL if 'sequential' in value.lower() else ExecutionPhase.PARALLEL
                 
-            elif line.startswith('Priority:'):
+            elif field == 'Priority':
                 try:
-                    current_task['priority'] = int(line.split(':', 1)[1].strip())
-                except:
+                    current_task['priority'] = int(value)
+                except ValueError:
                     current_task['priority'] = 3
                     
-            elif line.startswith('Dependencies:'):
-                deps = line.split(':', 1)[1].strip()
-                current_task['dependencies'] = [d.strip() for d in deps.split(',') if d.strip() and d.strip().lower() != 'none']
+            else:
+                current_task['dependencies'] = [d.strip() for d in value.split(',') if d.strip() and d.strip().lower() != 'none']
         
         # Add the last task
         if current_task:
@@ -214,28 +239,26 @@ Recommendation: Proceed with task execution through appropriate departments.
             priority=task_dict.get('priority', 3)
         )
         
-    async def _route_through_workflow(self, subtasks: list):
-        """Route tasks through workflow manager"""
-        self.log(f"🔄 Routing {len(subtasks)} tasks through workflow manager...")
-        self.log(f"📋 Available departments: {list(self.department_heads.keys())}")
+    async def _route_through_workflow(self, subtasks: AsyncIterator[Task]):
+        """Route tasks through workflow manager as they arrive, starting each one as soon as its dependencies are met"""
+        self.log("🔄 Routing tasks through workflow manager...")
+        self.log("📋 Available departments: %s", list(self.department_heads.keys()))
         
-        # Add tasks to workflow manager
-        tasks_added = 0
-        for task in subtasks:
-            self.log(f"📝 Processing task for department: {task.department}")
+        # Dispatch each task as it arrives rather than after the whole breakdown and a planning pass
+        runs = []
+        async for task in subtasks:
+            self.log("📝 Processing task for department: %s", task.department)
             if task.department in self.department_heads:
-                self.workflow_manager.add_task(task)
-                tasks_added += 1
-                self.log(f"✅ Added task to {task.department}: {task.description}")
+                runs.append(self.workflow_manager.dispatch(task))
+                await asyncio.sleep(0)  # Let the task start before the next one is broken out
+                self.log("✅ Dispatched task to %s: %s", task.department, task.description)
             else:
-                self.log(f"⚠️ No department head found for: {task.department}")
+                self.log("⚠️ No department head found for: %s", task.department)
         
-        self.log(f"📊 Added {tasks_added} tasks to workflow manager")
+        self.log("📊 Dispatched %s tasks to workflow manager", len(runs))
         
-        # Plan and execute workflow
-        if tasks_added > 0:
-            self.workflow_manager.plan_execution()
-            await self.workflow_manager.execute_workflow()
+        if runs:
+            await self.workflow_manager.wait_dispatched(runs)
         else:
             self.log("⚠️ No tasks were added to workflow manager")
         
@@ -243,46 +266,34 @@ Recommendation: Proceed with task execution through appropriate departments.
         """Get overall company status from all departments"""
         self.log("📊 Gathering company status from all departments...")
         
+        # Poll department heads concurrently, up to the processor's cap; one failure does not cancel the others
+        results = await asyncio.gather(
+            *(
+                self.background.enqueue(lambda head=dept_head: head.execute_task("Provide department status report"),
+                                        priority=STATUS_POLL_PRIORITY)
+                for dept_head in self.department_heads.values()
+            ),
+            return_exceptions=True
+        )
+        
         status_reports = {}
-        for dept_name, dept_head in self.department_heads.items():
-            try:
-                status = await dept_head.execute_task("Provide department status report")
-                status_reports[dept_name] = status
-            except Exception as e:
-                status_reports[dept_name] = f"Error getting status: {e}"
+        for dept_name, status in zip(self.department_heads.keys(), results):
+            if isinstance(status, Exception):
+                status = f"Error getting status: {status}"
+            status_reports[dept_name] = status
                 
         return status_reports
         
     async def make_strategic_decision(self, decision_context: str):
         """Make strategic decisions based on context"""
-        self.log(f"🎯 Making strategic decision: {decision_context}")
+        self.log("🎯 Making strategic decision: %s", decision_context)
         
         # Get research data for decision making
         research_data = await self.request_research(f"Strategic decision support: {decision_context}")
         
-        company_context = self.get_company_context()
-        
-        decision_prompt = f"""
-As CEO of {company_context['company_name']}, make a strategic decision:
-
-Context: {decision_context}
-Research Data: {research_data}
-Company Budget: {company_context['budget']} {company_context['currency']}
-Company Goal: {company_context['goal']}
-Target Market: {company_context['target_location']}
-
-Provide:
-1. Decision recommendation
-2. Rationale and supporting factors
-3. Resource allocation requirements
-4. Risk mitigation strategies
-5. Implementation timeline
-6. Success metrics
-
-Focus on Indian market dynamics and cultural considerations.
-"""
+        decision_prompt = f"Context: {decision_context}\nResearch Data: {clip(research_data)}\n"
         
-        decision = call_llm(decision_prompt)
+        decision = await acached_call_llm(decision_prompt, system=company_profile.preamble() + _DECISION_PROMPT, scope="ceo.strategic_decision")
         self.save_to_memory(f"Strategic Decision: {decision_context}", decision)
         
         return decision
\ No newline at end of file
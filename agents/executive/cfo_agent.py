@@ -1,20 +1,17 @@
 from agents.agent_base import AgentBase
-from langchain_groq import ChatGroq
-from langchain.schema.messages import HumanMessage
+from utils.llm_cache import acached_chat
+from utils.groq_client import GROQ_API_KEY, get_groq_client
 import asyncio
-import os
-from dotenv import load_dotenv
 
 class CFOAgent(AgentBase):
     def __init__(self, name="CFO Agent", department="executive", role="Chief Financial Officer", memory=None, memory_manager=None):
         super().__init__(name, department, role, memory, memory_manager)
-        load_dotenv()
-        api_key = os.getenv('GROQ_API_KEY') or os.getenv('GROQ_API_KEY_1') or os.getenv('GROQ_API_KEY_2')
+        api_key = GROQ_API_KEY
         if not api_key:
             self.log("⚠️ Warning: No GROQ_API_KEY environment variables found - running in limited mode")
             self.llm = None
         else:
-            self.llm = ChatGroq(temperature=0.3, model_name="llama3-8b-8192", api_key=api_key)  # Groq LLM setup
+            self.llm = get_groq_client(0.3, "llama3-8b-8192", api_key)  # Shared Groq client
 
     async def execute_task(self, task: str):
         self.log(f"💼 Received financial task: {task}")
@@ -24,24 +21,25 @@ class CFOAgent(AgentBase):
         self.log(f"📊 Financial Plan:\n{financial_plan}")
 
         # Delegate financial recommendations to CEO or COO
-        self.send_message_to("CEOAgent", f"Financial insights for {task}:\n{financial_plan}")
-        self.save_to_memory(task, financial_plan)
+        self.dispatch_messages(("CEOAgent", f"Financial insights for {task}:\n{financial_plan}"))
+        self.save_to_memory_async(task, financial_plan)
 
         return f"Financial analysis completed for: {task}"
 
     async def call_groq_for_financial_forecast(self, task_description: str):
         prompt = f"Analyze the following business task and provide financial recommendations, including budgeting, revenue forecasting, profit and loss estimates, and capital allocation: {task_description}"
-        response = self.llm([HumanMessage(content=prompt)])
-        return response.content.strip()
+        return await acached_chat(self.llm, prompt, scope="cfo.financial_forecast")
 
     async def generate_profit_and_loss(self):
         # Example: Generate a quarterly profit and loss statement for the company
         prompt = "Generate a quarterly profit and loss statement, considering revenue, expenses, and taxes."
-        response = self.llm([HumanMessage(content=prompt)])
+        from langchain.schema.messages import HumanMessage  # Deferred, LangChain is heavy to import
+        response = await self.llm.ainvoke([HumanMessage(content=prompt)])
         return response.content.strip()
 
     async def provide_investment_advice(self):
         # Example: Suggest investment strategies based on current financial health
         prompt = "Provide investment advice based on the current financial status and market trends."
-        response = self.llm([HumanMessage(content=prompt)])
+        from langchain.schema.messages import HumanMessage  # Deferred, LangChain is heavy to import
+        response = await self.llm.ainvoke([HumanMessage(content=prompt)])
         return response.content.strip()
\ No newline at end of file
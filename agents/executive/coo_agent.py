@@ -1,21 +1,37 @@
 from agents.agent_base import AgentBase
 import asyncio
-from langchain_groq import ChatGroq
-from langchain.schema.messages import HumanMessage
-import os
-from dotenv import load_dotenv
+import json
+from utils.llm_cache import acached_chat
+from utils.groq_client import GROQ_API_KEY, get_groq_client
+
+# Used when the LLM is unavailable or its strategy cannot be parsed
+_DEFAULT_ASSIGNMENTS = [
+    ("marketing", "Create a pre-launch awareness campaign"),
+    ("engineering", "Start building MVP architecture"),
+    ("product", "Define user flow and wireframes")
+]
+
+_JSON_DECODER = json.JSONDecoder()
+
+_STRATEGY_PROMPT = (
+    "Based on the following business objective, generate strategic task assignments for relevant departments. "
+    'Respond with only a JSON object of the form {{"tasks": [{{"department": "<department>", "subtask": "<subtask>"}}]}}, '
+    "using lowercase department names such as marketing, engineering, research or product.\n"
+    "Objective: {task}"
+)
 
 class COOAgent(AgentBase):
     def __init__(self, name="COO Agent", department="leadership", role="Chief Operating Officer", memory=None, memory_manager=None, scheduler=None):
         super().__init__(name, department, role, memory, memory_manager)
         self.scheduler = scheduler
-        load_dotenv()
-        api_key = os.getenv('GROQ_API_KEY') or os.getenv('GROQ_API_KEY_1') or os.getenv('GROQ_API_KEY_2')
+        api_key = GROQ_API_KEY
         if not api_key:
             self.log("⚠️ Warning: No GROQ_API_KEY environment variables found - running in limited mode")
             self.llm = None
         else:
-            self.llm = ChatGroq(temperature=0.3, model_name="llama3-8b-8192", api_key=api_key)  # Groq LLM setup
+            self.llm = get_groq_client(0.3, "llama3-8b-8192", api_key)  # Shared Groq client
+            # Groq JSON mode guarantees the strategy is a parseable object
+            self.llm = self.llm.bind(response_format={"type": "json_object"})
 
     async def execute_task(self, task: str):
         self.log(f"🔄 Received high-level directive: {task}")
@@ -23,12 +39,15 @@ class COOAgent(AgentBase):
         # Simulate task assignment and decision-making process
         await asyncio.sleep(1)
 
-        # Use Groq for strategic task assignment
-        try:
-            strategy = await self.call_groq_for_strategy(task)
-        except Exception as e:
-            self.log(f"Failed to get strategy from LLM: {e}")
+        # Use Groq for strategic task assignment; without a client the default plan is used as is
+        if self.llm is None:
             strategy = "COO Manual Review Required."
+        else:
+            try:
+                strategy = await self.call_groq_for_strategy(task)
+            except Exception as e:
+                self.log(f"Failed to get strategy from LLM: {e}")
+                strategy = "COO Manual Review Required."
 
         self.log(f"COO Strategy Output: {strategy}")
 
@@ -39,21 +58,32 @@ class COOAgent(AgentBase):
             self.log(f"Delegating to {dept}: {subtask}")
             try:
                 await self.scheduler.assign_task(dept, subtask)
-            except KeyError:
+            except (KeyError, ValueError):
                 self.log(f"No agent registered under department: {dept}")
 
         return "COO delegation complete."
 
     async def call_groq_for_strategy(self, task_description: str):
-        prompt = f"Based on the following business objective, generate strategic task assignments for relevant departments: {task_description}"
-        response = self.llm([HumanMessage(content=prompt)])
-        return response.content.strip()
+        prompt = _STRATEGY_PROMPT.format(task=task_description)
+        return await acached_chat(self.llm, prompt, scope="coo.strategy.json")
 
     def parse_strategy(self, strategy: str):
-        # Simulate parsing the strategy into actionable items
-        # Example strategy response parsing (this can be more complex depending on the output)
-        return [
-            ("Marketing", "Create a pre-launch awareness campaign"),
-            ("Engineering", "Start building MVP architecture"),
-            ("Product", "Define user flow and wireframes")
-        ]
\ No newline at end of file
+        """(department, subtask) pairs from the LLM's JSON strategy, or the default plan if it has none"""
+        start = min((i for i in (strategy.find("{"), strategy.find("[")) if i != -1), default=-1)
+        try:
+            # raw_decode ignores anything after the JSON value, e.g. a closing code fence
+            data = _JSON_DECODER.raw_decode(strategy, start)[0] if start != -1 else None
+        except json.JSONDecodeError:
+            data = None
+
+        items = data.get("tasks") if isinstance(data, dict) else data
+        subtasks = []
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            dept = item.get("department") or item.get("dept")
+            subtask = item.get("subtask") or item.get("task")
+            if isinstance(dept, str) and isinstance(subtask, str) and dept.strip() and subtask.strip():
+                subtasks.append((dept.strip().lower(), subtask.strip()))
+
+        return subtasks or list(_DEFAULT_ASSIGNMENTS)
@@ -1,20 +1,17 @@
 from agents.agent_base import AgentBase
-from langchain_groq import ChatGroq
-from langchain.schema.messages import HumanMessage
+from utils.llm_cache import acached_chat
+from utils.groq_client import GROQ_API_KEY, get_groq_client
 import asyncio
-import os
-from dotenv import load_dotenv
 
 class CTOAgent(AgentBase):
     def __init__(self, name="CTO Agent", department="executive", role="Chief Technology Officer", memory=None, memory_manager=None):
         super().__init__(name, department, role, memory, memory_manager)
-        load_dotenv()
-        api_key = os.getenv('GROQ_API_KEY') or os.getenv('GROQ_API_KEY_1') or os.getenv('GROQ_API_KEY_2')
+        api_key = GROQ_API_KEY
         if not api_key:
             self.log("⚠️ Warning: No GROQ_API_KEY environment variables found - running in limited mode")
             self.llm = None
         else:
-            self.llm = ChatGroq(temperature=0.4, model_name="llama3-8b-8192", api_key=api_key)  # Groq LLM setup
+            self.llm = get_groq_client(0.4, "llama3-8b-8192", api_key)  # Shared Groq client
 
     async def execute_task(self, task: str):
         self.log(f"💻 Received tech task: {task}")
@@ -24,12 +21,11 @@ class CTOAgent(AgentBase):
         self.log(f"🔧 Technology Recommendations:\n{tech_recommendations}")
 
         # Send recommendations to CEO or Engineering Manager
-        self.send_message_to("EngineeringManagerAgent", f"Tech recommendations for {task}:\n{tech_recommendations}")
-        self.save_to_memory(task, tech_recommendations)
+        self.dispatch_messages(("EngineeringManagerAgent", f"Tech recommendations for {task}:\n{tech_recommendations}"))
+        self.save_to_memory_async(task, tech_recommendations)
 
         return f"Technology recommendations generated for: {task}"
 
     async def call_groq_for_technology(self, task_description: str):
         prompt = f"Provide technology strategy recommendations for the following business objective: {task_description}. Include recommendations for technology stack, tools, and potential architecture decisions."
-        response = self.llm([HumanMessage(content=prompt)])
-        return response.content.strip()
\ No newline at end of file
+        return await acached_chat(self.llm, prompt, scope="cto.technology")
\ No newline at end of file
@@ -2,76 +2,146 @@
 
 from agents.agent_base import AgentBase
 from config.company_profile import company_profile
-from utils.llm_planner import call_llm
+from utils.llm_cache import acached_call_llm, is_error_response
+from utils.prompt_utils import clip
+from utils.prompt_cache import get_prompt_cache
+from collections import deque
 import asyncio
+import functools
+import re
+import time
+
+# Completed tasks kept per department head; older entries are dropped
+DEPARTMENT_TASK_HISTORY = 1000
+
+# Prompt scaffolds: the system message is the shared company preamble, the agent's role and
+# these fixed instructions; per-call inputs go in the user message
+_ANALYSIS_PROMPT = """
+Analyze the task below from your department's perspective:
+1. Relevance to department goals and capabilities
+2. Resource requirements and timeline
+3. Potential challenges and solutions
+4. Success criteria and deliverables
+5. Coordination needs with other departments
+6. Indian market specific considerations
+
+Provide actionable analysis for department execution.
+"""
+
+_EXECUTION_PROMPT = """
+Execute the task below with focus on:
+1. Department-specific expertise and approach
+2. Indian market considerations
+3. Budget efficiency within the company budget
+4. Alignment with company goals
+5. Quality deliverables and outcomes
+
+Provide detailed execution results and next steps.
+"""
+
+def saved_plan(scope: str):
+    """Persist a department head's long-form output across runs, keyed by the method's request
+    and the company profile, so re-running the same request skips research and the LLM;
+    pass cache=False to ignore the saved result"""
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, request: str, cache: bool = True):
+            plans = get_prompt_cache()
+            key = f"{company_profile.preamble()}\0{request}"
+            namespace = f"plan:{scope}"
+            if cache:
+                plan = await asyncio.to_thread(plans.get, key, namespace)
+                if plan is not None:
+                    self.log("♻️ Reusing saved %s for: %s", scope, request)
+                    return plan
+
+            plan = await method(self, request)
+            if not is_error_response(plan):
+                await asyncio.to_thread(plans.put, key, plan, namespace)
+            return plan
+        return wrapper
+    return decorator
 
 class DepartmentHeadBase(AgentBase):
     """Base class for all department heads in the executive team"""
     
+    # Tasks matching this are delegated to department agents; keywords match as substrings
+    _DELEGATION_RE = re.compile(r"implement|execute|develop|create|build|design", re.I)
+    # (keywords regex, agent name) pairs checked in order by _select_best_agent
+    _ROUTES = ()
+    
+    # Direct execution, specialised per department: instructions for the system message, the
+    # research query template ({task}) and how its result is labelled, and the result header
+    _EXECUTION_INSTRUCTIONS = _EXECUTION_PROMPT
+    _RESEARCH_QUERY = None
+    _RESEARCH_LABEL = "Research"
+    _EMOJI = "🎯"
+    _RESULT_LABEL = None  # Defaults to the agent's role
+    
     def __init__(self, name, department, role, memory=None, memory_manager=None, research_agent=None):
         super().__init__(name, department, role, memory, memory_manager, research_agent)
         self.department_agents = {}
-        self.department_tasks = []
+        self._primary_agent = None  # First registered agent, the default delegate
+        self.department_tasks = deque(maxlen=DEPARTMENT_TASK_HISTORY)
+        self.completed_task_count = 0
         
     def register_department_agent(self, agent_name: str, agent):
         """Register agents within this department"""
         self.department_agents[agent_name] = agent
-        self.log(f"✅ Registered department agent: {agent_name}")
+        self._primary_agent = next(iter(self.department_agents.values()))
+        self.log("✅ Registered department agent: %s", agent_name)
         
     async def execute_task(self, task: str):
         """Department head processes tasks and delegates to department agents"""
-        self.log(f"📋 Department head received task: {task}")
-        
-        # Analyze task from department perspective
-        department_analysis = await self._analyze_department_task(task)
+        self.log("📋 Department head received task: %s", task)
         
         # Determine if task needs delegation or direct execution
         if self._should_delegate(task):
+            department_analysis = await self._analyze_department_task(task)
             result = await self._delegate_task(task, department_analysis)
         else:
-            result = await self._execute_directly(task, department_analysis)
+            # The analysis and the research behind direct execution are independent, so fetch both at once
+            research_query = self._research_query(task)
+            if research_query:
+                department_analysis, research_data = await asyncio.gather(
+                    self._analyze_department_task(task), self.request_research(research_query)
+                )
+            else:
+                department_analysis, research_data = await self._analyze_department_task(task), None
+            result = await self._execute_directly(task, department_analysis, research_data)
             
         self.department_tasks.append({
             'task': task,
             'result': result,
-            'timestamp': self.created_at
+            'timestamp_ns': time.time_ns()
         })
+        self.completed_task_count += 1
         
         self.save_to_memory(task, result)
         return result
         
     async def _analyze_department_task(self, task: str):
         """Analyze task from department perspective"""
-        company_context = self.get_company_context()
-        
-        analysis_prompt = f"""
-You are the {self.role} of {company_context['company_name']}'s {self.department} department.
-Company: {company_context['description']}
-Target Market: {company_context['target_location']}
-Budget: {company_context['budget']} {company_context['currency']}
-
-Task: {task}
-
-Analyze this task from your department's perspective:
-1. Relevance to department goals and capabilities
-2. Resource requirements and timeline
-3. Potential challenges and solutions
-4. Success criteria and deliverables
-5. Coordination needs with other departments
-6. Indian market specific considerations
-
-Provide actionable analysis for department execution.
-"""
-        
-        analysis = call_llm(analysis_prompt)
+        analysis = await acached_call_llm(
+            f"Task: {task}\n",
+            system=self._system_prompt(_ANALYSIS_PROMPT),
+            scope=f"{self.name}.department_analysis",
+        )
         self.log("✅ Department task analysis completed")
         return analysis
         
+    def _system_prompt(self, instructions: str) -> str:
+        """Company preamble, role line and instructions; fixed per agent, so a stable prefix"""
+        return (
+            company_profile.preamble()
+            + f"\nYou are the {self.role} of the company's {self.department} department.\n"
+            + instructions
+        )
+        
     def _should_delegate(self, task: str) -> bool:
         """Determine if task should be delegated to department agents"""
-        # Override in specific department heads
-        delegation_keywords = ['implement', 'execute', 'develop', 'create', 'build', 'design']
-        return any(keyword in task.lower() for keyword in delegation_keywords)
+        # Specific department heads override _DELEGATION_RE
+        return self._DELEGATION_RE.search(task) is not None
         
     async def _delegate_task(self, task: str, analysis: str):
         """Delegate task to appropriate department agent"""
@@ -82,44 +152,37 @@ Provide actionable analysis for department execution.
         best_agent = self._select_best_agent(task)
         
         if best_agent:
-            self.log(f"🔄 Delegating to {best_agent.name}")
+            self.log("🔄 Delegating to %s", best_agent.name)
             return await best_agent.execute_task(task)
         else:
             return await self._execute_directly(task, analysis)
             
     def _select_best_agent(self, task: str):
-        """Select the best agent for the task - override in specific departments"""
-        if self.department_agents:
-            return list(self.department_agents.values())[0]
-        return None
+        """Select the best agent for the task; specific departments define _ROUTES"""
+        for keywords, agent_name in self._ROUTES:
+            if keywords.search(task):
+                return self.department_agents.get(agent_name)
+        return self._primary_agent
         
-    async def _execute_directly(self, task: str, analysis: str):
-        """Execute task directly as department head"""
-        self.log(f"⚡ Executing task directly: {task}")
+    def _research_query(self, task: str):
+        """Research query _execute_directly needs for the task, or None"""
+        return self._RESEARCH_QUERY.format(task=task) if self._RESEARCH_QUERY else None
         
-        company_context = self.get_company_context()
+    async def _execute_directly(self, task: str, analysis: str, research_data: str = None):
+        """Execute task directly as department head"""
+        self.log("%s Executing task directly: %s", self._EMOJI, task)
         
-        execution_prompt = f"""
-As {self.role} of {company_context['company_name']}, execute this task:
-
-Task: {task}
-Department Analysis: {analysis}
-Company Context: {company_context['description']}
-Target Market: {company_context['target_location']}
-
-Execute the task with focus on:
-1. Department-specific expertise and approach
-2. Indian market considerations
-3. Budget efficiency ({company_context['budget']} {company_context['currency']})
-4. Alignment with company goals
-5. Quality deliverables and outcomes
-
-Provide detailed execution results and next steps.
-"""
+        execution_prompt = f"Task: {task}\nDepartment Analysis: {analysis}\n"
+        research_query = self._research_query(task)
+        if research_query:
+            if research_data is None:
+                research_data = await self.request_research(research_query)
+            execution_prompt += f"{self._RESEARCH_LABEL}: {clip(research_data)}\n"
         
-        result = call_llm(execution_prompt)
+        # Exact matches only: the prompt embeds the analysis, which the task text alone does not capture
+        result = await acached_call_llm(execution_prompt, system=self._system_prompt(self._EXECUTION_INSTRUCTIONS), scope=f"{self.name}.execute_directly")
         self.log("✅ Direct execution completed")
-        return f"🎯 {self.role}: {result}"
+        return f"{self._EMOJI} {self._RESULT_LABEL or self.role}: {result}"
         
     async def get_department_status(self):
         """Get status of entire department"""
@@ -127,7 +190,7 @@ Provide detailed execution results and next steps.
             'department': self.department,
             'head': self.name,
             'agents_count': len(self.department_agents),
-            'completed_tasks': len(self.department_tasks),
+            'completed_tasks': self.completed_task_count,
             'agents': list(self.department_agents.keys())
         }
         
@@ -135,6 +198,6 @@ Provide detailed execution results and next steps.
         
     async def coordinate_with_department(self, other_department: str, message: str):
         """Coordinate with other department heads"""
-        self.log(f"🤝 Coordinating with {other_department}: {message}")
+        self.log("🤝 Coordinating with %s: %s", other_department, message)
         # This would be implemented with actual inter-department communication
         return f"Coordination message sent to {other_department}"
\ No newline at end of file
@@ -1,65 +1,21 @@
 # agents/executive/finance_head.py
 
-from agents.executive.department_head_base import DepartmentHeadBase
-from utils.llm_planner import call_llm
+from agents.executive.department_head_base import DepartmentHeadBase, saved_plan
+from config.company_profile import company_profile
+from utils.llm_cache import acached_call_llm
+from utils.prompt_utils import clip
+import re
 
-class FinanceHead(DepartmentHeadBase):
-    """Finance Department Head - manages financial strategy and operations"""
-    
-    def __init__(self, name="Finance Head", department="finance", role="Chief Financial Officer", memory=None, memory_manager=None, research_agent=None):
-        super().__init__(name, department, role, memory, memory_manager, research_agent)
-        
-    def _should_delegate(self, task: str) -> bool:
-        """Finance-specific delegation logic"""
-        delegation_keywords = [
-            'calculate', 'analyze financials', 'prepare budget', 'audit',
-            'tax planning', 'investment analysis', 'cost analysis'
-        ]
-        return any(keyword in task.lower() for keyword in delegation_keywords)
-        
-    def _select_best_agent(self, task: str):
-        """Select best finance agent for the task"""
-        task_lower = task.lower()
-        
-        # Accounting tasks
-        if any(word in task_lower for word in ['accounting', 'bookkeeping', 'ledger']):
-            return self.department_agents.get('accountant')
-            
-        # Analysis tasks
-        if any(word in task_lower for word in ['analysis', 'forecast', 'projection']):
-            return self.department_agents.get('financial_analyst')
-            
-        # Treasury tasks
-        if any(word in task_lower for word in ['cash', 'treasury', 'investment']):
-            return self.department_agents.get('treasurer')
-            
-        # Default to first available agent
-        return list(self.department_agents.values())[0] if self.department_agents else None
-        
-    async def _execute_directly(self, task: str, analysis: str):
-        """Execute finance task directly with Indian financial landscape focus"""
-        self.log(f"💰 Finance Head executing: {task}")
-        
-        # Get financial research
-        research_query = f"Financial research for Indian market: {task}"
-        research_data = await self.request_research(research_query)
-        
-        company_context = self.get_company_context()
-        
-        finance_prompt = f"""
-As Chief Financial Officer of {company_context['company_name']}, execute this financial task:
+# Agent routing keywords, matched as substrings
+_ACCOUNTING_RE = re.compile(r"accounting|bookkeeping|ledger", re.I)
+_ANALYSIS_RE = re.compile(r"analysis|forecast|projection", re.I)
+_TREASURY_RE = re.compile(r"cash|treasury|investment", re.I)
 
-Task: {task}
-Analysis: {analysis}
-Financial Research: {research_data}
-
-Company Details:
-- Sector: {company_context['sector']}
-- Target: {company_context['target_location']}
-- Budget: {company_context['budget']} {company_context['currency']}
-- Goal: {company_context['goal']}
-
-Execute with focus on:
+# Prompt scaffolds: the system message is the shared company preamble (and, for direct execution,
+# the role line) plus these fixed instructions, so every request shares one cacheable prefix;
+# per-call inputs go in the user message
+_EXECUTION_PROMPT = """
+Execute the financial task below with focus on:
 1. Indian financial regulations and compliance (RBI, SEBI, GST)
 2. Tax optimization strategies for Indian businesses
 3. Currency considerations and forex management
@@ -73,28 +29,9 @@ Execute with focus on:
 
 Provide detailed financial strategy and implementation plan.
 """
-        
-        result = call_llm(finance_prompt)
-        return f"💰 Financial Strategy: {result}"
-        
-    async def create_budget_plan(self, budget_requirements: str):
-        """Create comprehensive budget plan"""
-        self.log(f"📊 Creating budget plan: {budget_requirements}")
-        
-        company_context = self.get_company_context()
-        
-        # Get budget research
-        budget_research = await self.request_research(f"Budget planning for Indian business: {budget_requirements}")
-        
-        budget_prompt = f"""
-Create comprehensive budget plan for {company_context['company_name']}:
-
-Budget Requirements: {budget_requirements}
-Research Data: {budget_research}
-Available Budget: {company_context['budget']} {company_context['currency']}
-Business Sector: {company_context['sector']}
 
-Create budget plan covering:
+_BUDGET_PLAN_PROMPT = """
+Create a comprehensive budget plan for the requirements below, covering:
 1. Revenue projections and assumptions
 2. Operating expense breakdown
 3. Capital expenditure planning
@@ -108,27 +45,9 @@ Create budget plan covering:
 
 Focus on Indian market costs, taxation, and business environment.
 """
-        
-        budget_plan = call_llm(budget_prompt)
-        self.save_to_memory(f"Budget Plan: {budget_requirements}", budget_plan)
-        
-        return f"📊 Budget Plan: {budget_plan}"
-        
-    async def analyze_financial_performance(self, performance_period: str):
-        """Analyze financial performance"""
-        self.log(f"📈 Analyzing financial performance: {performance_period}")
-        
-        company_context = self.get_company_context()
-        
-        performance_prompt = f"""
-Analyze financial performance for {company_context['company_name']}:
 
-Performance Period: {performance_period}
-Company Sector: {company_context['sector']}
-Target Market: {company_context['target_location']}
-Budget: {company_context['budget']} {company_context['currency']}
-
-Provide analysis covering:
+_PERFORMANCE_PROMPT = """
+Analyze the company's financial performance for the period below, covering:
 1. Revenue analysis and growth trends
 2. Profitability and margin analysis
 3. Cost structure and efficiency metrics
@@ -142,8 +61,51 @@ Provide analysis covering:
 
 Consider Indian market dynamics and economic factors.
 """
+
+class FinanceHead(DepartmentHeadBase):
+    """Finance Department Head - manages financial strategy and operations"""
+    
+    _DELEGATION_RE = re.compile(r"calculate|analyze financials|prepare budget|audit|tax planning|investment analysis|cost analysis", re.I)
+    
+    # Routing in priority order; the first matching agent gets the task
+    _ROUTES = (
+        (_ACCOUNTING_RE, 'accountant'),
+        (_ANALYSIS_RE, 'financial_analyst'),
+        (_TREASURY_RE, 'treasurer'),
+    )
+    
+    _EXECUTION_INSTRUCTIONS = _EXECUTION_PROMPT
+    _RESEARCH_QUERY = "Financial research for Indian market: {task}"
+    _RESEARCH_LABEL = "Financial Research"
+    _EMOJI = "💰"
+    _RESULT_LABEL = "Financial Strategy"
+    
+    def __init__(self, name="Finance Head", department="finance", role="Chief Financial Officer", memory=None, memory_manager=None, research_agent=None):
+        super().__init__(name, department, role, memory, memory_manager, research_agent)
+        
+    @saved_plan("finance_head.budget_plan")
+    async def create_budget_plan(self, budget_requirements: str):
+        """Create comprehensive budget plan"""
+        self.log("📊 Creating budget plan: %s", budget_requirements)
+        
+        # Get budget research
+        budget_research = await self.request_research(f"Budget planning for Indian business: {budget_requirements}")
+        
+        budget_prompt = f"Budget Requirements: {budget_requirements}\nResearch Data: {clip(budget_research)}\n"
+        
+        budget_plan = await acached_call_llm(budget_prompt, system=company_profile.preamble() + _BUDGET_PLAN_PROMPT, scope="finance_head.budget_plan")
+        self.save_to_memory(f"Budget Plan: {budget_requirements}", budget_plan)
+        
+        return f"📊 Budget Plan: {budget_plan}"
+        
+    @saved_plan("finance_head.financial_performance")
+    async def analyze_financial_performance(self, performance_period: str):
+        """Analyze financial performance"""
+        self.log("📈 Analyzing financial performance: %s", performance_period)
+        
+        performance_prompt = f"Performance Period: {performance_period}\n"
         
-        analysis = call_llm(performance_prompt)
+        analysis = await acached_call_llm(performance_prompt, system=company_profile.preamble() + _PERFORMANCE_PROMPT, scope="finance_head.performance")
         self.save_to_memory(f"Financial Performance: {performance_period}", analysis)
         
         return f"📈 Financial Analysis: {analysis}"
\ No newline at end of file
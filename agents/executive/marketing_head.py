@@ -1,65 +1,21 @@
 # agents/executive/marketing_head.py
 
-from agents.executive.department_head_base import DepartmentHeadBase
-from utils.llm_planner import call_llm
+from agents.executive.department_head_base import DepartmentHeadBase, saved_plan
+from config.company_profile import company_profile
+from utils.llm_cache import acached_call_llm
+from utils.prompt_utils import clip
+import re
 
-class MarketingHead(DepartmentHeadBase):
-    """Marketing Department Head - manages marketing strategy and campaigns"""
-    
-    def __init__(self, name="Marketing Head", department="marketing", role="Chief Marketing Officer", memory=None, memory_manager=None, research_agent=None):
-        super().__init__(name, department, role, memory, memory_manager, research_agent)
-        
-    def _should_delegate(self, task: str) -> bool:
-        """Marketing-specific delegation logic"""
-        delegation_keywords = [
-            'create content', 'write copy', 'design campaign', 'social media',
-            'blog post', 'advertisement', 'promotional material', 'content strategy'
-        ]
-        return any(keyword in task.lower() for keyword in delegation_keywords)
-        
-    def _select_best_agent(self, task: str):
-        """Select best marketing agent for the task"""
-        task_lower = task.lower()
-        
-        # Content-related tasks
-        if any(word in task_lower for word in ['content', 'copy', 'write', 'blog']):
-            return self.department_agents.get('content_creator')
-            
-        # Campaign-related tasks
-        if any(word in task_lower for word in ['campaign', 'strategy', 'plan']):
-            return self.department_agents.get('campaign_manager')
-            
-        # Social media tasks
-        if any(word in task_lower for word in ['social', 'instagram', 'facebook', 'twitter']):
-            return self.department_agents.get('social_media_manager')
-            
-        # Default to first available agent
-        return list(self.department_agents.values())[0] if self.department_agents else None
-        
-    async def _execute_directly(self, task: str, analysis: str):
-        """Execute marketing task directly with Indian market focus"""
-        self.log(f"📢 Marketing Head executing: {task}")
-        
-        # Get market research for marketing decisions
-        research_query = f"Marketing research for Indian market: {task}"
-        research_data = await self.request_research(research_query)
-        
-        company_context = self.get_company_context()
-        
-        marketing_prompt = f"""
-As Chief Marketing Officer of {company_context['company_name']}, execute this marketing task:
-
-Task: {task}
-Analysis: {analysis}
-Market Research: {research_data}
+# Agent routing keywords, matched as substrings
+_CONTENT_RE = re.compile(r"content|copy|write|blog", re.I)
+_CAMPAIGN_RE = re.compile(r"campaign|strategy|plan", re.I)
+_SOCIAL_RE = re.compile(r"social|instagram|facebook|twitter", re.I)
 
-Company Details:
-- Sector: {company_context['sector']}
-- Target: {company_context['target_location']}
-- Budget: {company_context['budget']} {company_context['currency']}
-- Goal: {company_context['goal']}
-
-Execute with focus on:
+# Prompt scaffolds: the system message is the shared company preamble (and, for direct execution,
+# the role line) plus these fixed instructions, so every request shares one cacheable prefix;
+# per-call inputs go in the user message
+_EXECUTION_PROMPT = """
+Execute the marketing task below with focus on:
 1. Indian consumer behavior and preferences
 2. Cultural sensitivity and local relevance
 3. Cost-effective marketing channels for Indian market
@@ -71,36 +27,9 @@ Execute with focus on:
 
 Provide detailed marketing strategy and execution plan.
 """
-        
-        result = call_llm(marketing_prompt)
-        return f"📢 Marketing Strategy: {result}"
-        
-    async def create_marketing_campaign(self, campaign_objective: str):
-        """Create comprehensive marketing campaign"""
-        self.log(f"🎯 Creating marketing campaign: {campaign_objective}")
-        
-        # Get market insights
-        market_research = await self.request_research(f"Campaign research: {campaign_objective}")
-        
-        campaign_task = f"Create comprehensive marketing campaign for: {campaign_objective}"
-        return await self.execute_task(campaign_task)
-        
-    async def analyze_market_opportunity(self, opportunity: str):
-        """Analyze market opportunity"""
-        self.log(f"📊 Analyzing market opportunity: {opportunity}")
-        
-        research_data = await self.request_research(f"Market opportunity analysis: {opportunity}")
-        
-        company_context = self.get_company_context()
-        
-        analysis_prompt = f"""
-As CMO, analyze this market opportunity for {company_context['company_name']}:
-
-Opportunity: {opportunity}
-Research Data: {research_data}
-Current Focus: {company_context['sector']} in {company_context['target_location']}
 
-Provide analysis covering:
+_OPPORTUNITY_PROMPT = """
+As CMO, analyze the market opportunity below, covering:
 1. Market size and potential in India
 2. Target audience segmentation
 3. Competitive landscape
@@ -112,8 +41,46 @@ Provide analysis covering:
 
 Focus on Indian market dynamics and consumer behavior.
 """
+
+class MarketingHead(DepartmentHeadBase):
+    """Marketing Department Head - manages marketing strategy and campaigns"""
+    
+    _DELEGATION_RE = re.compile(r"create content|write copy|design campaign|social media|blog post|advertisement|promotional material|content strategy", re.I)
+    
+    # Routing in priority order; the first matching agent gets the task
+    _ROUTES = (
+        (_CONTENT_RE, 'content_creator'),
+        (_CAMPAIGN_RE, 'campaign_manager'),
+        (_SOCIAL_RE, 'social_media_manager'),
+    )
+    
+    _EXECUTION_INSTRUCTIONS = _EXECUTION_PROMPT
+    _RESEARCH_QUERY = "Marketing research for Indian market: {task}"
+    _RESEARCH_LABEL = "Market Research"
+    _EMOJI = "📢"
+    _RESULT_LABEL = "Marketing Strategy"
+    
+    def __init__(self, name="Marketing Head", department="marketing", role="Chief Marketing Officer", memory=None, memory_manager=None, research_agent=None):
+        super().__init__(name, department, role, memory, memory_manager, research_agent)
+        
+    async def create_marketing_campaign(self, campaign_objective: str):
+        """Create comprehensive marketing campaign"""
+        self.log("🎯 Creating marketing campaign: %s", campaign_objective)
+        
+        # execute_task gathers its own market research when it executes the task directly
+        campaign_task = f"Create comprehensive marketing campaign for: {campaign_objective}"
+        return await self.execute_task(campaign_task)
+        
+    @saved_plan("marketing_head.market_opportunity")
+    async def analyze_market_opportunity(self, opportunity: str):
+        """Analyze market opportunity"""
+        self.log("📊 Analyzing market opportunity: %s", opportunity)
+        
+        research_data = await self.request_research(f"Market opportunity analysis: {opportunity}")
+        
+        analysis_prompt = f"Opportunity: {opportunity}\nResearch Data: {clip(research_data)}\n"
         
-        analysis = call_llm(analysis_prompt)
+        analysis = await acached_call_llm(analysis_prompt, system=company_profile.preamble() + _OPPORTUNITY_PROMPT, scope="marketing_head.opportunity")
         self.save_to_memory(f"Market Opportunity: {opportunity}", analysis)
         
         return f"📊 Market Analysis: {analysis}"
\ No newline at end of file
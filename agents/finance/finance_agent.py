@@ -3,17 +3,221 @@ Finance Agent - Budget analysis and financial reporting
 """
 import os
 import json
-from typing import Dict, List, Any, Optional
+import re
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from agents.agent_base import AgentBase
 
+# Task routing keywords, matched as substrings
+_BUDGET_RE = re.compile(r"budget", re.I)
+_REPORT_RE = re.compile(r"financial report|finance report", re.I)
+_FORECAST_RE = re.compile(r"forecast", re.I)
+_ROI_RE = re.compile(r"roi|return on investment", re.I)
+
+# Canned analysis content; lists are shared tuples, dicts are copied so results stay caller-owned
+_BUDGET_VARIANCE = (
+    'Personnel costs 5% under budget due to delayed hiring',
+    'Marketing spend 12% over budget due to additional campaigns',
+    'Technology costs on track with budget allocations',
+    'Facilities costs 3% under budget due to remote work'
+)
+
+_COST_OPTIMIZATION = (
+    'Consolidate software subscriptions to reduce licensing costs',
+    'Negotiate better rates with vendors for bulk purchases',
+    'Implement energy-efficient practices to reduce utility costs',
+    'Optimize marketing spend by focusing on high-ROI channels',
+    'Consider remote work options to reduce facility costs'
+)
+
+_BUDGET_RECOMMENDATIONS = (
+    'Increase marketing budget allocation for Q4 campaigns',
+    'Create contingency fund for unexpected technology needs',
+    'Invest in employee training and development programs',
+    'Review and optimize vendor contracts annually',
+    'Implement monthly budget review meetings'
+)
+
+_BUDGET_RISKS = (
+    'Economic downturn could impact revenue projections',
+    'Inflation may increase operational costs',
+    'Currency fluctuations for international operations',
+    'Regulatory changes may require additional compliance costs',
+    'Technology disruption may require additional investments'
+)
+
+_APPROVAL_WORKFLOW = {
+    'department_head': 'Initial budget review and approval',
+    'finance_team': 'Financial analysis and validation',
+    'executive_team': 'Strategic alignment and final approval',
+    'board_approval': 'Required for budgets over $1M'
+}
+
+_CASH_FLOW_DATA = {
+    'operating_cash_flow': 120000,
+    'investing_cash_flow': -50000,
+    'financing_cash_flow': -20000,
+    'net_cash_flow': 50000,
+    'cash_position': 300000
+}
+
+_KEY_METRICS = {
+    'gross_margin': 65.0,
+    'operating_margin': 20.0,
+    'net_margin': 20.0,
+    'roa': 15.0,
+    'roe': 18.0,
+    'current_ratio': 2.5,
+    'debt_to_equity': 0.3
+}
+
+_VARIANCE_ANALYSIS = {
+    'revenue_variance': 'Revenue exceeded budget by 8% due to strong product sales',
+    'expense_variance': 'Expenses were 3% over budget due to increased marketing spend',
+    'profit_variance': 'Net profit exceeded projections by 15%'
+}
+
+_FORECASTS = {
+    'next_quarter_revenue': 550000,
+    'next_quarter_expenses': 420000,
+    'next_quarter_profit': 130000,
+    'annual_revenue_forecast': 2200000,
+    'annual_profit_forecast': 520000
+}
+
+_FORECAST_ASSUMPTIONS = (
+    'Revenue growth rate of 2% per month',
+    'Expense inflation of 1% per month',
+    'No major market disruptions',
+    'Stable customer acquisition rates',
+    'Current pricing strategy maintained'
+)
+
+_FINANCIAL_HEALTH = {
+    'liquidity': 'Strong - sufficient cash reserves',
+    'profitability': 'Good - healthy profit margins',
+    'efficiency': 'Improving - better asset utilization',
+    'leverage': 'Conservative - low debt levels',
+    'overall_rating': 'Healthy'
+}
+
+_PERFORMANCE_METRICS = {
+    'revenue_growth': 15.2,
+    'profit_growth': 22.8,
+    'margin_improvement': 2.3,
+    'asset_turnover': 1.8,
+    'return_on_assets': 12.5,
+    'return_on_equity': 18.7
+}
+
+_TREND_ANALYSIS = {
+    'revenue_trend': 'Positive - consistent growth over 12 months',
+    'expense_trend': 'Controlled - expenses growing slower than revenue',
+    'profitability_trend': 'Improving - margins expanding',
+    'cash_flow_trend': 'Stable - positive operating cash flow'
+}
+
+_INDUSTRY_BENCHMARKING = {
+    'revenue_growth': 'Above industry average (12%)',
+    'profit_margins': 'In line with industry standards',
+    'operational_efficiency': 'Better than industry median',
+    'financial_leverage': 'Conservative compared to peers'
+}
+
+_FINANCIAL_RECOMMENDATIONS = (
+    'Continue focus on revenue growth initiatives',
+    'Optimize cost structure for improved margins',
+    'Consider strategic investments for market expansion',
+    'Maintain strong cash position for opportunities',
+    'Regular financial performance monitoring and reporting'
+)
+
+_RETURN_MULTIPLIERS = {
+    'marketing_campaign': 3.0,
+    'technology_upgrade': 2.5,
+    'new_product': 4.0,
+    'market_expansion': 3.5
+}
+
+_PAYBACK_PERIODS = {
+    'marketing_campaign': '8 months',
+    'technology_upgrade': '12 months',
+    'new_product': '18 months',
+    'market_expansion': '15 months'
+}
+
+_INVESTMENT_RISKS = {
+    'marketing_campaign': 'Medium - dependent on market response',
+    'technology_upgrade': 'Low - proven technology benefits',
+    'new_product': 'High - market acceptance uncertainty',
+    'market_expansion': 'Medium-High - regulatory and competitive risks'
+}
+
+# Budget allocation ratios by department, in breakdown order
+_BREAKDOWN_MARKETING = (
+    ('advertising', 0.4),
+    ('content_creation', 0.2),
+    ('events_and_conferences', 0.15),
+    ('marketing_tools', 0.1),
+    ('personnel', 0.1),
+    ('miscellaneous', 0.05)
+)
+
+_BREAKDOWN_ENGINEERING = (
+    ('personnel', 0.6),
+    ('infrastructure', 0.15),
+    ('software_licenses', 0.1),
+    ('equipment', 0.08),
+    ('training', 0.05),
+    ('miscellaneous', 0.02)
+)
+
+_BREAKDOWN_COMPANY_WIDE = (
+    ('personnel', 0.5),
+    ('marketing', 0.2),
+    ('operations', 0.15),
+    ('technology', 0.08),
+    ('facilities', 0.05),
+    ('contingency', 0.02)
+)
+
+_BREAKDOWNS = {'marketing': _BREAKDOWN_MARKETING, 'engineering': _BREAKDOWN_ENGINEERING}
+
+# Monthly forecast model: base amounts scaled per scenario, growing linearly month over month
+FORECAST_MAX_MONTHS = 12
+_MONTH_KEYS = tuple(f'month_{i + 1}' for i in range(FORECAST_MAX_MONTHS))
+_BASE_MONTHLY_REVENUE = 200000
+_BASE_MONTHLY_EXPENSES = 160000
+_REVENUE_MULTIPLIERS = {'conservative': 0.9, 'realistic': 1.0, 'optimistic': 1.2}
+_EXPENSE_MULTIPLIERS = {'conservative': 0.95, 'realistic': 1.0, 'optimistic': 1.1}
+_REVENUE_GROWTH = tuple(1 + i * 0.02 for i in range(FORECAST_MAX_MONTHS))
+_EXPENSE_GROWTH = tuple(1 + i * 0.01 for i in range(FORECAST_MAX_MONTHS))
+
+
+def _forecast_months(period: str) -> int:
+    return 12 if '12' in period else 6
+
+@lru_cache(maxsize=256)
+def _pretty(name: str) -> str:
+    """Display form of a snake_case key, e.g. 'company_wide' -> 'Company Wide'"""
+    return name.replace('_', ' ').title()
+
 
 class FinanceAgent(AgentBase):
     """Finance Agent for budget analysis and financial reporting"""
     
+    # Routing in priority order; the first matching handler gets the task
+    _ROUTES = (
+        (_BUDGET_RE, '_create_budget_analysis'),
+        (_REPORT_RE, '_create_financial_report'),
+        (_FORECAST_RE, '_create_financial_forecast'),
+        (_ROI_RE, '_analyze_roi'),
+    )
+    
     def __init__(self):
         super().__init__(
             name="Finance Agent",
@@ -31,34 +235,28 @@ class FinanceAgent(AgentBase):
     
     async def execute_task(self, task: str) -> Dict[str, Any]:
         """Execute finance-related tasks"""
+        now = datetime.now()  # One clock read per task, shared by timestamps, filenames and periods
         try:
             if isinstance(task, str):
                 task_dict = {'description': task, 'type': 'general'}
             else:
                 task_dict = task
             
-            task_description = task_dict.get('description', '').lower()
+            task_description = task_dict.get('description', '')
             
-            if 'budget' in task_description:
-                return self._create_budget_analysis(task_dict)
-            elif 'financial report' in task_description or 'finance report' in task_description:
-                return self._create_financial_report(task_dict)
-            elif 'forecast' in task_description:
-                return self._create_financial_forecast(task_dict)
-            elif 'roi' in task_description or 'return on investment' in task_description:
-                return self._analyze_roi(task_dict)
-            else:
-                return self._general_financial_analysis(task_dict)
+            handler = next((name for pattern, name in self._ROUTES if pattern.search(task_description)),
+                           '_general_financial_analysis')
+            return getattr(self, handler)(task_dict, now)
                 
         except Exception as e:
             return {
                 'success': False,
                 'error': f"Finance task processing failed: {str(e)}",
                 'agent': self.name,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now.isoformat()
             }
     
-    def _create_budget_analysis(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_budget_analysis(self, task: Dict[str, Any], now: datetime) -> Dict[str, Any]:
         """Create comprehensive budget analysis"""
         budget_period = task.get('period', 'annual')
         department = task.get('department', 'company_wide')
@@ -84,30 +282,24 @@ class FinanceAgent(AgentBase):
             'department': department,
             'total_budget': budget_amount,
             'agent': self.name,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
         
         # Generate budget spreadsheet
         try:
+            # Category, amount and percentage cells are formatted once and shared by both documents
+            breakdown = budget_analysis['budget_breakdown']
+            breakdown_rows = self._breakdown_rows(breakdown, budget_amount)
+            
             # Prepare data for Excel
             budget_data = {
                 'Budget Summary': {
                     'headers': ['Category', 'Allocated Budget', 'Percentage', 'Quarterly Split'],
-                    'rows': []
+                    'rows': (row + [f"${amount / 4:,}"] for row, amount in zip(breakdown_rows, breakdown.values()))
                 }
             }
             
-            for category, amount in budget_analysis['budget_breakdown'].items():
-                percentage = (amount / budget_amount) * 100
-                quarterly = amount / 4
-                budget_data['Budget Summary']['rows'].append([
-                    category.replace('_', ' ').title(),
-                    f"${amount:,}",
-                    f"{percentage:.1f}%",
-                    f"${quarterly:,}"
-                ])
-            
-            filename = f"budget_analysis_{department}_{budget_period}_{datetime.now().strftime('%Y%m%d')}"
+            filename = f"budget_analysis_{department}_{budget_period}_{now.strftime('%Y%m%d')}"
             xlsx_path = self.create_document(budget_data, 'xlsx', filename)
             
             if xlsx_path:
@@ -116,21 +308,20 @@ class FinanceAgent(AgentBase):
             
             # Also create a detailed report document
             doc_content = {
-                'title': f'Budget Analysis Report - {department.replace("_", " ").title()}',
+                'title': f'Budget Analysis Report - {_pretty(department)}',
                 'author': self.name,
                 'subject': f'{budget_period.title()} Budget Analysis',
                 'executive_summary': f'Comprehensive budget analysis for {department} covering {budget_period} period with total budget of ${budget_amount:,}.',
                 'sections': [
                     {
                         'title': 'Budget Overview',
-                        'content': f'Total Budget: ${budget_amount:,}\\nPeriod: {budget_period.title()}\\nDepartment: {department.replace("_", " ").title()}\\nAnalysis Date: {datetime.now().strftime("%B %d, %Y")}'
+                        'content': f'Total Budget: ${budget_amount:,}\\nPeriod: {budget_period.title()}\\nDepartment: {_pretty(department)}\\nAnalysis Date: {now.strftime("%B %d, %Y")}'
                     },
                     {
                         'title': 'Budget Breakdown',
                         'table': {
                             'headers': ['Category', 'Amount', 'Percentage'],
-                            'rows': [[cat.replace('_', ' ').title(), f"${amt:,}", f"{(amt/budget_amount)*100:.1f}%"] 
-                                   for cat, amt in budget_analysis['budget_breakdown'].items()]
+                            'rows': breakdown_rows
                         }
                     },
                     {
@@ -159,7 +350,7 @@ class FinanceAgent(AgentBase):
         
         return result
     
-    def _create_financial_report(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_financial_report(self, task: Dict[str, Any], now: datetime) -> Dict[str, Any]:
         """Create comprehensive financial report"""
         report_type = task.get('report_type', 'quarterly')
         include_forecasts = task.get('include_forecasts', True)
@@ -179,9 +370,9 @@ class FinanceAgent(AgentBase):
             'success': True,
             'financial_report': financial_data,
             'report_type': report_type,
-            'reporting_period': self._get_reporting_period(report_type),
+            'reporting_period': self._get_reporting_period(report_type, now),
             'agent': self.name,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
         
         # Generate financial report spreadsheet
@@ -207,17 +398,15 @@ class FinanceAgent(AgentBase):
                 },
                 'Revenue Breakdown': {
                     'headers': ['Revenue Source', 'Amount', 'Percentage'],
-                    'rows': [[source.replace('_', ' ').title(), f"${amount:,}", f"{(amount/financial_data['revenue']['total'])*100:.1f}%"] 
-                           for source, amount in financial_data['revenue']['breakdown'].items()]
+                    'rows': self._breakdown_rows(financial_data['revenue']['breakdown'], financial_data['revenue']['total'])
                 },
                 'Expense Breakdown': {
                     'headers': ['Expense Category', 'Amount', 'Percentage'],
-                    'rows': [[category.replace('_', ' ').title(), f"${amount:,}", f"{(amount/financial_data['expenses']['total'])*100:.1f}%"] 
-                           for category, amount in financial_data['expenses']['breakdown'].items()]
+                    'rows': self._breakdown_rows(financial_data['expenses']['breakdown'], financial_data['expenses']['total'])
                 }
             }
             
-            filename = f"financial_report_{report_type}_{datetime.now().strftime('%Y%m%d')}"
+            filename = f"financial_report_{report_type}_{now.strftime('%Y%m%d')}"
             xlsx_path = self.create_document(report_data, 'xlsx', filename)
             
             if xlsx_path:
@@ -230,19 +419,17 @@ class FinanceAgent(AgentBase):
         
         return result
     
-    def _create_financial_forecast(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    def _breakdown_rows(self, breakdown: Dict[str, Any], total) -> List[List[str]]:
+        """Format a category breakdown as [name, amount, share of total] table rows in one pass"""
+        return [[_pretty(category), f"${amount:,}", f"{(amount/total)*100:.1f}%"]
+                for category, amount in breakdown.items()]
+    
+    def _create_financial_forecast(self, task: Dict[str, Any], now: datetime) -> Dict[str, Any]:
         """Create financial forecast"""
         forecast_period = task.get('forecast_period', '12_months')
         scenarios = task.get('scenarios', ['conservative', 'realistic', 'optimistic'])
         
-        forecast_data = {}
-        for scenario in scenarios:
-            forecast_data[scenario] = {
-                'revenue_forecast': self._forecast_revenue(scenario, forecast_period),
-                'expense_forecast': self._forecast_expenses(scenario, forecast_period),
-                'profit_forecast': self._forecast_profit(scenario, forecast_period),
-                'cash_flow_forecast': self._forecast_cash_flow(scenario, forecast_period)
-            }
+        forecast_data = {scenario: self._forecast_scenario(scenario, forecast_period) for scenario in scenarios}
         
         result = {
             'success': True,
@@ -251,12 +438,12 @@ class FinanceAgent(AgentBase):
             'scenarios': scenarios,
             'assumptions': self._document_forecast_assumptions(),
             'agent': self.name,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
         
         return result
     
-    def _analyze_roi(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_roi(self, task: Dict[str, Any], now: datetime) -> Dict[str, Any]:
         """Analyze return on investment"""
         investment_amount = task.get('investment_amount', 100000)
         investment_type = task.get('investment_type', 'marketing_campaign')
@@ -278,10 +465,10 @@ class FinanceAgent(AgentBase):
             'success': True,
             'roi_analysis': roi_analysis,
             'agent': self.name,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
     
-    def _general_financial_analysis(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    def _general_financial_analysis(self, task: Dict[str, Any], now: datetime) -> Dict[str, Any]:
         """General financial analysis"""
         analysis_type = task.get('analysis_type', 'performance_review')
         
@@ -298,82 +485,29 @@ class FinanceAgent(AgentBase):
             'financial_analysis': analysis,
             'analysis_type': analysis_type,
             'agent': self.name,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
     
     # Helper methods for financial calculations and data generation
     def _generate_budget_breakdown(self, total_budget: int, department: str) -> Dict[str, int]:
         """Generate realistic budget breakdown"""
-        if department == 'marketing':
-            return {
-                'advertising': int(total_budget * 0.4),
-                'content_creation': int(total_budget * 0.2),
-                'events_and_conferences': int(total_budget * 0.15),
-                'marketing_tools': int(total_budget * 0.1),
-                'personnel': int(total_budget * 0.1),
-                'miscellaneous': int(total_budget * 0.05)
-            }
-        elif department == 'engineering':
-            return {
-                'personnel': int(total_budget * 0.6),
-                'infrastructure': int(total_budget * 0.15),
-                'software_licenses': int(total_budget * 0.1),
-                'equipment': int(total_budget * 0.08),
-                'training': int(total_budget * 0.05),
-                'miscellaneous': int(total_budget * 0.02)
-            }
-        else:  # company_wide
-            return {
-                'personnel': int(total_budget * 0.5),
-                'marketing': int(total_budget * 0.2),
-                'operations': int(total_budget * 0.15),
-                'technology': int(total_budget * 0.08),
-                'facilities': int(total_budget * 0.05),
-                'contingency': int(total_budget * 0.02)
-            }
+        ratios = _BREAKDOWNS.get(department, _BREAKDOWN_COMPANY_WIDE)
+        return {category: int(total_budget * ratio) for category, ratio in ratios}
     
-    def _analyze_budget_variance(self) -> List[str]:
-        return [
-            'Personnel costs 5% under budget due to delayed hiring',
-            'Marketing spend 12% over budget due to additional campaigns',
-            'Technology costs on track with budget allocations',
-            'Facilities costs 3% under budget due to remote work'
-        ]
+    def _analyze_budget_variance(self) -> Tuple[str, ...]:
+        return _BUDGET_VARIANCE
     
-    def _identify_cost_optimization(self) -> List[str]:
-        return [
-            'Consolidate software subscriptions to reduce licensing costs',
-            'Negotiate better rates with vendors for bulk purchases',
-            'Implement energy-efficient practices to reduce utility costs',
-            'Optimize marketing spend by focusing on high-ROI channels',
-            'Consider remote work options to reduce facility costs'
-        ]
+    def _identify_cost_optimization(self) -> Tuple[str, ...]:
+        return _COST_OPTIMIZATION
     
-    def _generate_budget_recommendations(self) -> List[str]:
-        return [
-            'Increase marketing budget allocation for Q4 campaigns',
-            'Create contingency fund for unexpected technology needs',
-            'Invest in employee training and development programs',
-            'Review and optimize vendor contracts annually',
-            'Implement monthly budget review meetings'
-        ]
+    def _generate_budget_recommendations(self) -> Tuple[str, ...]:
+        return _BUDGET_RECOMMENDATIONS
     
-    def _identify_budget_risks(self) -> List[str]:
-        return [
-            'Economic downturn could impact revenue projections',
-            'Inflation may increase operational costs',
-            'Currency fluctuations for international operations',
-            'Regulatory changes may require additional compliance costs',
-            'Technology disruption may require additional investments'
-        ]
+    def _identify_budget_risks(self) -> Tuple[str, ...]:
+        return _BUDGET_RISKS
     
     def _define_approval_workflow(self) -> Dict[str, str]:
-        return {
-            'department_head': 'Initial budget review and approval',
-            'finance_team': 'Financial analysis and validation',
-            'executive_team': 'Strategic alignment and final approval',
-            'board_approval': 'Required for budgets over $1M'
-        }
+        return dict(_APPROVAL_WORKFLOW)
     
     def _generate_revenue_data(self, report_type: str) -> Dict[str, Any]:
         base_revenue = 500000 if report_type == 'quarterly' else 2000000
@@ -419,109 +553,61 @@ class FinanceAgent(AgentBase):
         }
     
     def _generate_cash_flow_data(self) -> Dict[str, Any]:
-        return {
-            'operating_cash_flow': 120000,
-            'investing_cash_flow': -50000,
-            'financing_cash_flow': -20000,
-            'net_cash_flow': 50000,
-            'cash_position': 300000
-        }
+        return dict(_CASH_FLOW_DATA)
     
     def _calculate_key_metrics(self) -> Dict[str, Any]:
-        return {
-            'gross_margin': 65.0,
-            'operating_margin': 20.0,
-            'net_margin': 20.0,
-            'roa': 15.0,
-            'roe': 18.0,
-            'current_ratio': 2.5,
-            'debt_to_equity': 0.3
-        }
+        return dict(_KEY_METRICS)
     
     def _perform_variance_analysis(self) -> Dict[str, str]:
-        return {
-            'revenue_variance': 'Revenue exceeded budget by 8% due to strong product sales',
-            'expense_variance': 'Expenses were 3% over budget due to increased marketing spend',
-            'profit_variance': 'Net profit exceeded projections by 15%'
-        }
+        return dict(_VARIANCE_ANALYSIS)
     
     def _generate_forecasts(self) -> Dict[str, Any]:
-        return {
-            'next_quarter_revenue': 550000,
-            'next_quarter_expenses': 420000,
-            'next_quarter_profit': 130000,
-            'annual_revenue_forecast': 2200000,
-            'annual_profit_forecast': 520000
-        }
+        return dict(_FORECASTS)
     
-    def _get_reporting_period(self, report_type: str) -> str:
+    def _get_reporting_period(self, report_type: str, now: datetime) -> str:
         if report_type == 'quarterly':
-            return f"Q{((datetime.now().month - 1) // 3) + 1} {datetime.now().year}"
+            return f"Q{((now.month - 1) // 3) + 1} {now.year}"
         elif report_type == 'monthly':
-            return datetime.now().strftime("%B %Y")
+            return now.strftime("%B %Y")
         else:
-            return str(datetime.now().year)
+            return str(now.year)
     
     def _forecast_revenue(self, scenario: str, period: str) -> Dict[str, int]:
-        base_monthly = 200000
-        multipliers = {'conservative': 0.9, 'realistic': 1.0, 'optimistic': 1.2}
-        multiplier = multipliers.get(scenario, 1.0)
-        
-        months = 12 if '12' in period else 6
-        return {f'month_{i+1}': int(base_monthly * multiplier * (1 + i * 0.02)) 
-                for i in range(months)}
+        monthly = _BASE_MONTHLY_REVENUE * _REVENUE_MULTIPLIERS.get(scenario, 1.0)
+        months = _forecast_months(period)
+        return {key: int(monthly * growth) for key, growth in zip(_MONTH_KEYS[:months], _REVENUE_GROWTH)}
     
     def _forecast_expenses(self, scenario: str, period: str) -> Dict[str, int]:
-        base_monthly = 160000
-        multipliers = {'conservative': 0.95, 'realistic': 1.0, 'optimistic': 1.1}
-        multiplier = multipliers.get(scenario, 1.0)
-        
-        months = 12 if '12' in period else 6
-        return {f'month_{i+1}': int(base_monthly * multiplier * (1 + i * 0.01)) 
-                for i in range(months)}
+        monthly = _BASE_MONTHLY_EXPENSES * _EXPENSE_MULTIPLIERS.get(scenario, 1.0)
+        months = _forecast_months(period)
+        return {key: int(monthly * growth) for key, growth in zip(_MONTH_KEYS[:months], _EXPENSE_GROWTH)}
     
-    def _forecast_profit(self, scenario: str, period: str) -> Dict[str, int]:
+    def _forecast_scenario(self, scenario: str, period: str) -> Dict[str, Dict[str, int]]:
+        """Revenue, expense, profit and cash flow forecasts for one scenario, each month computed once"""
         revenue = self._forecast_revenue(scenario, period)
         expenses = self._forecast_expenses(scenario, period)
+        profit = {month: revenue[month] - expenses[month] for month in revenue}
         
-        return {month: revenue[month] - expenses[month] 
-                for month in revenue.keys()}
-    
-    def _forecast_cash_flow(self, scenario: str, period: str) -> Dict[str, int]:
-        profit = self._forecast_profit(scenario, period)
-        # Simplified cash flow = profit + depreciation - capex
-        return {month: int(profit[month] * 1.1) for month in profit.keys()}
+        return {
+            'revenue_forecast': revenue,
+            'expense_forecast': expenses,
+            'profit_forecast': profit,
+            # Simplified cash flow = profit + depreciation - capex
+            'cash_flow_forecast': {month: int(amount * 1.1) for month, amount in profit.items()}
+        }
     
-    def _document_forecast_assumptions(self) -> List[str]:
-        return [
-            'Revenue growth rate of 2% per month',
-            'Expense inflation of 1% per month',
-            'No major market disruptions',
-            'Stable customer acquisition rates',
-            'Current pricing strategy maintained'
-        ]
+    def _document_forecast_assumptions(self) -> Tuple[str, ...]:
+        return _FORECAST_ASSUMPTIONS
     
     def _calculate_expected_returns(self, investment: int, inv_type: str) -> int:
-        multipliers = {
-            'marketing_campaign': 3.0,
-            'technology_upgrade': 2.5,
-            'new_product': 4.0,
-            'market_expansion': 3.5
-        }
-        return int(investment * multipliers.get(inv_type, 2.0))
+        return int(investment * _RETURN_MULTIPLIERS.get(inv_type, 2.0))
     
     def _calculate_roi_percentage(self, investment: int, inv_type: str) -> float:
         returns = self._calculate_expected_returns(investment, inv_type)
         return ((returns - investment) / investment) * 100
     
     def _calculate_payback_period(self, investment: int, inv_type: str) -> str:
-        periods = {
-            'marketing_campaign': '8 months',
-            'technology_upgrade': '12 months',
-            'new_product': '18 months',
-            'market_expansion': '15 months'
-        }
-        return periods.get(inv_type, '12 months')
+        return _PAYBACK_PERIODS.get(inv_type, '12 months')
     
     def _calculate_npv(self, investment: int, inv_type: str) -> int:
         returns = self._calculate_expected_returns(investment, inv_type)
@@ -531,13 +617,7 @@ class FinanceAgent(AgentBase):
         return int(npv)
     
     def _assess_investment_risk(self, inv_type: str) -> str:
-        risks = {
-            'marketing_campaign': 'Medium - dependent on market response',
-            'technology_upgrade': 'Low - proven technology benefits',
-            'new_product': 'High - market acceptance uncertainty',
-            'market_expansion': 'Medium-High - regulatory and competitive risks'
-        }
-        return risks.get(inv_type, 'Medium - standard business risk')
+        return _INVESTMENT_RISKS.get(inv_type, 'Medium - standard business risk')
     
     def _generate_investment_recommendations(self, inv_type: str) -> List[str]:
         return [
@@ -549,45 +629,16 @@ class FinanceAgent(AgentBase):
         ]
     
     def _assess_financial_health(self) -> Dict[str, str]:
-        return {
-            'liquidity': 'Strong - sufficient cash reserves',
-            'profitability': 'Good - healthy profit margins',
-            'efficiency': 'Improving - better asset utilization',
-            'leverage': 'Conservative - low debt levels',
-            'overall_rating': 'Healthy'
-        }
+        return dict(_FINANCIAL_HEALTH)
     
     def _calculate_performance_metrics(self) -> Dict[str, float]:
-        return {
-            'revenue_growth': 15.2,
-            'profit_growth': 22.8,
-            'margin_improvement': 2.3,
-            'asset_turnover': 1.8,
-            'return_on_assets': 12.5,
-            'return_on_equity': 18.7
-        }
+        return dict(_PERFORMANCE_METRICS)
     
     def _perform_trend_analysis(self) -> Dict[str, str]:
-        return {
-            'revenue_trend': 'Positive - consistent growth over 12 months',
-            'expense_trend': 'Controlled - expenses growing slower than revenue',
-            'profitability_trend': 'Improving - margins expanding',
-            'cash_flow_trend': 'Stable - positive operating cash flow'
-        }
+        return dict(_TREND_ANALYSIS)
     
     def _perform_industry_benchmarking(self) -> Dict[str, str]:
-        return {
-            'revenue_growth': 'Above industry average (12%)',
-            'profit_margins': 'In line with industry standards',
-            'operational_efficiency': 'Better than industry median',
-            'financial_leverage': 'Conservative compared to peers'
-        }
+        return dict(_INDUSTRY_BENCHMARKING)
     
-    def _generate_financial_recommendations(self) -> List[str]:
-        return [
-            'Continue focus on revenue growth initiatives',
-            'Optimize cost structure for improved margins',
-            'Consider strategic investments for market expansion',
-            'Maintain strong cash position for opportunities',
-            'Regular financial performance monitoring and reporting'
-        ]
\ No newline at end of file
+    def _generate_financial_recommendations(self) -> Tuple[str, ...]:
+        return _FINANCIAL_RECOMMENDATIONS
\ No newline at end of file
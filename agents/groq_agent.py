@@ -0,0 +1,42 @@
+from agents.agent_base import AgentBase
+from utils.llm_cache import acached_chat
+from utils.groq_client import GROQ_API_KEY, get_groq_client
+
+class GroqAgent(AgentBase):
+    """Agent that answers each task with one Groq completion and reports it to another agent.
+    Subclasses set the prompt, logging and reporting details as class attributes"""
+
+    _MODEL_NAME = "llama3-8b-8192"
+    _TEMPERATURE = 0.3
+    _SYSTEM_PROMPT = None  # Fixed instructions, sent as the system message; the task is the user message
+    _CACHE_SCOPE = ""
+    _RECEIVED_LOG = "📥 Received task"
+    _RESULT_HEADER = "💬 Response:"
+    _REPORT_TO = "CEOAgent"
+    _REPORT_TEMPLATE = "Results for {task}:\n{result}"
+    _DONE_TEMPLATE = "Task completed for: {task}"
+
+    def __init__(self, name, department, role, memory=None, memory_manager=None):
+        super().__init__(name, department, role, memory, memory_manager)
+        api_key = GROQ_API_KEY
+        if not api_key:
+            self.log("⚠️ Warning: No GROQ_API_KEY environment variables found - running in limited mode")
+            self.llm = None
+        else:
+            self.llm = get_groq_client(self._TEMPERATURE, self._MODEL_NAME, api_key)  # Shared Groq client
+
+    async def execute_task(self, task: str):
+        self.log("%s: %s", self._RECEIVED_LOG, task)
+
+        stream = self.log_stream(self._RESULT_HEADER)
+        result = await self.call_groq(task, on_chunk=stream.write)
+        stream.close(result)
+
+        self.dispatch_messages((self._REPORT_TO, self._REPORT_TEMPLATE.format(task=task, result=result)))
+        self.save_to_memory_async(task, result)
+
+        return self._DONE_TEMPLATE.format(task=task)
+
+    async def call_groq(self, task_description: str, on_chunk=None):
+        return await acached_chat(self.llm, task_description, system=self._SYSTEM_PROMPT,
+                                  scope=self._CACHE_SCOPE, on_chunk=on_chunk)
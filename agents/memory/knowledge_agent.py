@@ -92,9 +92,9 @@ class KnowledgeAgent(AgentBase):
         elif data_type == "unstructured":
             return self.store_unstructured(agent_id, sanitized_content, sanitized_metadata)
     
-    def retrieve_data(self, agent_id: str, query: str, data_type: str = None, filters: dict = None):
+    def retrieve_data(self, agent_id: str, query: str, data_type: str = None, filters: dict = None, limit: int = None):
         """
-        Retrieve data based on query and filters
+        Retrieve data based on query and filters (newest first, at most `limit` entries when given)
         """
         self.log(f"Retrieving data for agent {agent_id} with query: {query}")
         
@@ -124,6 +124,8 @@ class KnowledgeAgent(AgentBase):
                         )
             
             # Execute query
+            if limit:
+                query_obj = query_obj.order_by(KnowledgeEntry.created_at.desc()).limit(limit)
             results = query_obj.all()
             
             # Convert to dictionary format
@@ -249,45 +251,7 @@ class KnowledgeAgent(AgentBase):
             
             # Generate query embedding
             query_embedding = self._generate_embedding(query)
-            
-            # Build similarity search query using pgvector
-            similarity_query = session.query(
-                KnowledgeEntry,
-                KnowledgeEntry.embedding.cosine_distance(query_embedding).label('distance')
-            ).filter(
-                KnowledgeEntry.content_type == "unstructured",
-                KnowledgeEntry.embedding.is_not(None)
-            )
-            
-            # Apply filters if provided
-            if filters:
-                if "agent_id" in filters:
-                    similarity_query = similarity_query.filter(
-                        KnowledgeEntry.agent_id == uuid.UUID(filters["agent_id"])
-                    )
-                if "metadata_contains" in filters:
-                    similarity_query = similarity_query.filter(
-                        KnowledgeEntry.entry_metadata.contains(filters["metadata_contains"])
-                    )
-                if "created_after" in filters:
-                    similarity_query = similarity_query.filter(
-                        KnowledgeEntry.created_at >= filters["created_after"]
-                    )
-            
-            # Order by similarity and limit results
-            results = similarity_query.order_by('distance').limit(top_k).all()
-            
-            # Format results
-            formatted_results = []
-            for entry, distance in results:
-                formatted_results.append({
-                    "id": str(entry.id),
-                    "agent_id": str(entry.agent_id),
-                    "content": entry.content,
-                    "metadata": entry.entry_metadata,
-                    "similarity_score": 1.0 - float(distance),  # Convert distance to similarity
-                    "created_at": entry.created_at.isoformat()
-                })
+            formatted_results = self._run_similarity_query(session, query_embedding, top_k, filters)
             
             session.close()
             
@@ -303,6 +267,49 @@ class KnowledgeAgent(AgentBase):
             self.log(f"Error performing similarity search: {str(e)}")
             return {"status": "error", "message": str(e)}
     
+    def _run_similarity_query(self, session, query_embedding: List[float], top_k: int, filters: dict = None):
+        """Run a single pgvector similarity query and format the results"""
+        # Build similarity search query using pgvector
+        similarity_query = session.query(
+            KnowledgeEntry,
+            KnowledgeEntry.embedding.cosine_distance(query_embedding).label('distance')
+        ).filter(
+            KnowledgeEntry.content_type == "unstructured",
+            KnowledgeEntry.embedding.is_not(None)
+        )
+        
+        # Apply filters if provided
+        if filters:
+            if "agent_id" in filters:
+                similarity_query = similarity_query.filter(
+                    KnowledgeEntry.agent_id == uuid.UUID(filters["agent_id"])
+                )
+            if "metadata_contains" in filters:
+                similarity_query = similarity_query.filter(
+                    KnowledgeEntry.entry_metadata.contains(filters["metadata_contains"])
+                )
+            if "created_after" in filters:
+                similarity_query = similarity_query.filter(
+                    KnowledgeEntry.created_at >= filters["created_after"]
+                )
+        
+        # Order by similarity and limit results
+        results = similarity_query.order_by('distance').limit(top_k).all()
+        
+        # Format results
+        formatted_results = []
+        for entry, distance in results:
+            formatted_results.append({
+                "id": str(entry.id),
+                "agent_id": str(entry.agent_id),
+                "content": entry.content,
+                "metadata": entry.entry_metadata,
+                "similarity_score": 1.0 - float(distance),  # Convert distance to similarity
+                "created_at": entry.created_at.isoformat()
+            })
+        
+        return formatted_results
+    
     def get_by_id(self, data_id: str):
         """
         Retrieve specific data by ID
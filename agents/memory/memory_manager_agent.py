@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import re
 import time
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
@@ -16,6 +17,15 @@ from .security_validator import SecurityValidator, AccessLevel
 from .error_handler import ErrorHandler, with_error_handling, ValidationError, SecurityError
 from config.memory_config import load_memory_config
 
+# Task routing keywords, matched case-insensitively as substrings
+_STORE_RE = re.compile(r"store|save", re.I)
+_RETRIEVE_RE = re.compile(r"retrieve|search", re.I)
+_HISTORY_RE = re.compile(r"history", re.I)
+_LEARN_RE = re.compile(r"learn|pattern", re.I)
+_DATA_RE = re.compile(r"data|information|knowledge|content", re.I)
+_CONVERSATION_RE = re.compile(r"conversation|chat|message|action|log", re.I)
+_ANALYSIS_RE = re.compile(r"analyze|pattern|insight|recommendation|metric", re.I)
+
 
 class MemoryManagerAgent(AgentBase):
     """
@@ -124,13 +134,13 @@ class MemoryManagerAgent(AgentBase):
         
         try:
             # Enhanced task routing logic with error handling
-            if "store" in task.lower() or "save" in task.lower():
+            if _STORE_RE.search(task):
                 return await self._route_storage_request(task)
-            elif "retrieve" in task.lower() or "search" in task.lower():
+            elif _RETRIEVE_RE.search(task):
                 return await self._route_retrieval_request(task)
-            elif "history" in task.lower():
+            elif _HISTORY_RE.search(task):
                 return await self._route_history_request(task)
-            elif "learn" in task.lower() or "pattern" in task.lower():
+            elif _LEARN_RE.search(task):
                 return await self._route_learning_request(task)
             else:
                 return await self._handle_general_request(task)
@@ -208,18 +218,16 @@ class MemoryManagerAgent(AgentBase):
         self.log(f"Handling general memory request: {task}")
         
         # Try to intelligently route based on task content
-        task_lower = task.lower()
-        
         # Check for data-related keywords
-        if any(keyword in task_lower for keyword in ["data", "information", "knowledge", "content"]):
+        if _DATA_RE.search(task):
             return await self._route_storage_request(task)
         
         # Check for conversation-related keywords
-        if any(keyword in task_lower for keyword in ["conversation", "chat", "message", "action", "log"]):
+        if _CONVERSATION_RE.search(task):
             return await self._route_history_request(task)
         
         # Check for analysis-related keywords
-        if any(keyword in task_lower for keyword in ["analyze", "pattern", "insight", "recommendation", "metric"]):
+        if _ANALYSIS_RE.search(task):
             return await self._route_learning_request(task)
         
         # Default fallback
@@ -386,7 +394,7 @@ class MemoryManagerAgent(AgentBase):
             return {"status": "error", "message": str(e), "agent_id": agent_id}
     
     def retrieve_data(self, agent_id: str, query: str, data_type: str = None, filters: dict = None,
-                     requesting_agent_id: str = None, requesting_agent_department: str = None):
+                     requesting_agent_id: str = None, requesting_agent_department: str = None, limit: int = None):
         """
         Retrieve data through the appropriate specialized agent with caching and error handling
         """
@@ -427,7 +435,7 @@ class MemoryManagerAgent(AgentBase):
             
             # Generate cache key
             filters_hash = CacheKeyGenerator.hash_content(sanitized_filters or {})
-            cache_key = f"retrieve:agent:{agent_id}:type:{data_type or 'any'}:query:{CacheKeyGenerator.hash_content(sanitized_query)}:filters:{filters_hash}"
+            cache_key = f"retrieve:agent:{agent_id}:type:{data_type or 'any'}:query:{CacheKeyGenerator.hash_content(sanitized_query)}:filters:{filters_hash}:limit:{limit or 'all'}"
             
             # Try cache first
             knowledge_cache = self.cache_manager.get_cache('knowledge')
@@ -450,7 +458,7 @@ class MemoryManagerAgent(AgentBase):
                     "query": query
                 }
             
-            result = self.knowledge_agent.retrieve_data(agent_id, sanitized_query, data_type, sanitized_filters)
+            result = self.knowledge_agent.retrieve_data(agent_id, sanitized_query, data_type, sanitized_filters, limit)
             
             # Cache successful results
             if result.get("status") != "error":
@@ -0,0 +1,32 @@
+from utils.memory_writer import memory_writer
+from utils.project_store import get_project_store
+from datetime import datetime
+import asyncio
+
+# get_project_status lists only the most recent projects
+PROJECT_HISTORY_LIMIT = 1000
+
+class ProjectHistoryMixin:
+    """Project history for agents, kept in the shared project store under the agent's name"""
+
+    def _record_project(self, task: str, result: str, status: str):
+        """Queue a project for the project store, off the request path"""
+        memory_writer.submit(self._store_project, task, result, status, datetime.utcnow().isoformat())
+
+    def _store_project(self, task: str, result: str, status: str, timestamp: str):
+        get_project_store().insert(self.name, task, result, timestamp, status)
+
+    async def get_project_status(self):
+        """Get project status"""
+        total, completed, projects = await asyncio.to_thread(self._read_project_status)
+        return {
+            'total_projects': total,
+            'completed_projects': completed,
+            'projects': projects
+        }
+
+    def _read_project_status(self):
+        memory_writer.flush()  # Include projects still queued for the store
+        store = get_project_store()
+        total, completed = store.counts(self.name)
+        return total, completed, store.recent(self.name, PROJECT_HISTORY_LIMIT)
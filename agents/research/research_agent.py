@@ -2,7 +2,7 @@
 
 from agents.agent_base import AgentBase
 from config.company_profile import company_profile
-from utils.llm_planner import call_llm
+from utils.llm_planner import acall_llm
 import asyncio
 
 class ResearchAgent(AgentBase):
@@ -18,7 +18,7 @@ class ResearchAgent(AgentBase):
         self.log(f"🔍 Research task received: {task}")
         
         # Get company context for targeted research
-        company_context = company_profile.get_context()
+        company_context = company_profile.get_context_dict()
         
         # Enhanced prompt with Indian market focus
         research_prompt = f"""
@@ -67,7 +67,7 @@ Key Findings for Indian Market:
 Recommendation: Proceed with localized approach focusing on Indian market needs.
 """
         else:
-            research_result = call_llm(research_prompt)
+            research_result = await acall_llm(research_prompt)  # Off the event loop, so concurrent work keeps running
         
         # Cache the result
         self.research_cache[cache_key] = research_result
@@ -3,7 +3,6 @@ R&D Agent - Research & Innovation Reports
 """
 import os
 import json
-import requests
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import sys
@@ -12,6 +11,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from agents.agent_base import AgentBase
 from utils.memory_system_init import get_memory_manager_for_agent
+from utils.http_session import http_session
 
 
 class RnDAgent(AgentBase):
@@ -405,7 +405,7 @@ class RnDAgent(AgentBase):
         """Search academic papers using ArXiv API"""
         try:
             query = f"search_query=all:{topic.replace(' ', '+')}"
-            response = requests.get(
+            response = http_session.get(
                 f"{self.arxiv_api_base}?{query}&start=0&max_results=10",
                 timeout=10
             )
@@ -443,7 +443,7 @@ class RnDAgent(AgentBase):
                 'num': 5
             }
             
-            response = requests.get(
+            response = http_session.get(
                 'https://www.googleapis.com/customsearch/v1',
                 params=params,
                 timeout=10
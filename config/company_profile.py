@@ -5,6 +5,18 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+DEFAULT_CURRENCY = "USD"  # Budgets are entered and displayed in dollars
+
+COMPANY_PREAMBLE_TMPL = """
+Company Profile:
+- Company: {company_name}
+- Sector: {sector}
+- Description: {description}
+- Target Market: {target_location}
+- Budget: {budget} {currency}
+- Goal: {goal}
+"""
+
 class CompanyProfile:
     """Manages company profile configuration"""
     
@@ -18,12 +30,16 @@ class CompanyProfile:
         self.target_location = "India"
         self.created_at = None
         self.updated_at = None
+        self._context = None  # Rendered get_context() string, reset on profile changes
+        self._context_dict = None
+        self._rendered = {}  # Prompt template -> rendered text for the current profile
         
         # Load existing profile if it exists
         self.load_profile()
     
     def load_profile(self):
         """Load company profile from file"""
+        self._invalidate()
         try:
             if self.config_file.exists():
                 with open(self.config_file, 'r') as f:
@@ -73,6 +89,7 @@ class CompanyProfile:
         self.sector = sector
         self.goal = goal
         self.target_location = target_location
+        self._invalidate()
         
         if not self.created_at:
             self.created_at = datetime.now().isoformat()
@@ -81,6 +98,9 @@ class CompanyProfile:
     
     def get_context(self) -> str:
         """Get company context for agents"""
+        if self._context is not None:
+            return self._context
+        
         if not self.company_name:
             return "Company profile not set up yet."
         
@@ -93,7 +113,41 @@ Company Profile:
 - Goal: {self.goal}
 - Target Location: {self.target_location}
 """
-        return context.strip()
+        self._context = context.strip()
+        return self._context
+    
+    def get_context_dict(self) -> dict:
+        """Get company context as a mapping for prompt templates"""
+        if self._context_dict is None:
+            self._context_dict = {
+                'company_name': self.company_name,
+                'description': self.description,
+                'sector': self.sector,
+                'budget': self.budget,
+                'currency': DEFAULT_CURRENCY,
+                'goal': self.goal,
+                'target_location': self.target_location,
+                'market_focus': f"{self.target_location} market"
+            }
+        return self._context_dict
+    
+    def preamble(self) -> str:
+        """Canonical company block that opens executive prompts; its fixed field order keeps it
+        byte-identical across calls and agents so providers can reuse it as a cached prefix"""
+        return self.render(COMPANY_PREAMBLE_TMPL)
+    
+    def render(self, template: str) -> str:
+        """Render a str.format template against the company context, once per profile change"""
+        rendered = self._rendered.get(template)
+        if rendered is None:
+            rendered = self._rendered[template] = template.format_map(self.get_context_dict())
+        return rendered
+    
+    def _invalidate(self):
+        """Drop cached context renderings after the profile changes"""
+        self._context = None
+        self._context_dict = None
+        self._rendered = {}
     
     def is_configured(self) -> bool:
         """Check if company profile is configured"""
@@ -0,0 +1,86 @@
+# engine/async_processor.py
+
+import asyncio
+import itertools
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+# Lower numbers run first
+DEFAULT_PRIORITY = 5
+DEFAULT_MAX_INFLIGHT = 4
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BASE_BACKOFF = 1.0
+
+@dataclass
+class _Job:
+    factory: Callable[[], Awaitable[Any]]
+    future: asyncio.Future
+    attempt: int = 0
+
+class AsyncProcessor:
+    """Priority queue of deferrable jobs drained by a bounded pool of workers"""
+
+    def __init__(self, max_inflight: int = DEFAULT_MAX_INFLIGHT, max_retries: int = DEFAULT_MAX_RETRIES,
+                 base_backoff: float = DEFAULT_BASE_BACKOFF):
+        self.max_inflight = max_inflight
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self._counter = itertools.count()  # FIFO tie-break within a priority and deadline
+        self._loop = None
+        self._queue = None
+        self._workers = []
+
+    def enqueue(self, factory: Callable[[], Awaitable[Any]], priority: int = DEFAULT_PRIORITY,
+                deadline: float = None) -> asyncio.Future:
+        """Queue factory() to run when a worker is free; deadline is seconds from now after which
+        the job is dropped. factory is called again on each retry, so it must build a fresh awaitable"""
+        loop = self._ensure_workers()
+        due = loop.time() + deadline if deadline is not None else float("inf")
+        job = _Job(factory, loop.create_future())
+        self._queue.put_nowait((priority, due, next(self._counter), job))
+        return job.future
+
+    def pending(self) -> int:
+        """Number of jobs waiting for a worker"""
+        return self._queue.qsize() if self._queue else 0
+
+    def _ensure_workers(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or the previous event loop has gone away along with its workers
+            self._loop = loop
+            self._queue = asyncio.PriorityQueue()
+            self._workers = [loop.create_task(self._worker()) for _ in range(self.max_inflight)]
+            print(f"[AsyncProcessor] ✅ Started {self.max_inflight} workers")
+        return loop
+
+    async def _worker(self):
+        while True:
+            priority, due, _, job = await self._queue.get()
+            try:
+                await self._run(priority, due, job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, priority: int, due: float, job: _Job):
+        if job.future.done():
+            return  # Caller gave up while the job was queued
+
+        if self._loop.time() > due:
+            job.future.set_exception(asyncio.TimeoutError("Job deadline passed before a worker was free"))
+            return
+
+        try:
+            result = await job.factory()
+        except Exception as e:
+            if job.attempt < self.max_retries:
+                delay = self.base_backoff * 2 ** job.attempt
+                job.attempt += 1
+                print(f"[AsyncProcessor] ⚠️ Job failed ({e}), retry {job.attempt} in {delay:.1f}s")
+                self._loop.call_later(delay, self._queue.put_nowait, (priority, due, next(self._counter), job))
+            elif not job.future.done():
+                job.future.set_exception(e)
+            return
+
+        if not job.future.done():
+            job.future.set_result(result)
@@ -1,6 +1,9 @@
 # engine/workflow_manager.py
 
 import asyncio
+import heapq
+import itertools
+import sys
 from enum import Enum
 from typing import Dict, List, Any
 from dataclasses import dataclass
@@ -9,7 +12,7 @@ class ExecutionPhase(Enum):
     SEQUENTIAL = "sequential"
     PARALLEL = "parallel"
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: str
     description: str
@@ -23,15 +26,57 @@ class Task:
     def __post_init__(self):
         if self.dependencies is None:
             self.dependencies = []
+        # Department names recur across every task; share one string object per name
+        self.department = sys.intern(self.department)
+
+# Ceiling on tasks running against department agents at once
+MAX_INFLIGHT_TASKS = 8
+
+class _PriorityGate:
+    """Semaphore whose waiters are admitted by sort key rather than arrival order"""
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.inflight = 0
+        self._waiters = []
+        self._counter = itertools.count()
+        
+    async def acquire(self, key):
+        if self.inflight < self.limit and not self._waiters:
+            self.inflight += 1
+            return
+            
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (key, next(self._counter), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # Slot was handed over just as the waiter was cancelled
+            raise
+            
+    def release(self):
+        # Hand the slot straight to the best live waiter so newcomers cannot jump ahead
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.inflight -= 1
 
 class WorkflowManager:
     """Manages task execution flow with sequential and parallel phases"""
     
-    def __init__(self, scheduler):
+    def __init__(self, scheduler, max_inflight: int = MAX_INFLIGHT_TASKS):
         self.scheduler = scheduler
+        self._gate = _PriorityGate(max_inflight)
         self.tasks: Dict[str, Task] = {}
         self.execution_order = []
         self.completed_tasks = set()
+        # Event-driven dispatch state: per-task completion events watched by dependents
+        self._completion_events: Dict[str, asyncio.Event] = {}
+        self._sequential_lock = asyncio.Lock()
+        self._running = set()
         
     def add_task(self, task: Task):
         """Add a task to the workflow"""
@@ -88,7 +133,7 @@ class WorkflowManager:
         for task in tasks:
             if self._can_execute(task):
                 print(f"[WorkflowManager] ⏳ Executing sequential task: {task.id}")
-                result = await self.scheduler.assign_task(task.department, task.description)
+                result = await self._assign(task)
                 task.result = result
                 task.status = "completed"
                 self.completed_tasks.add(task.id)
@@ -131,7 +176,75 @@ class WorkflowManager:
     async def _execute_single_task(self, task: Task):
         """Execute a single task"""
         print(f"[WorkflowManager] ⏳ Executing parallel task: {task.id}")
-        return await self.scheduler.assign_task(task.department, task.description)
+        return await self._assign(task)
+        
+    async def _assign(self, task: Task):
+        """Assign a task to its department once a slot is free; higher-priority tasks deeper
+        in the dependency graph are admitted first so started workflows drain before new ones"""
+        await self._gate.acquire((task.priority, -len(task.dependencies)))
+        try:
+            return await self.scheduler.assign_task(task.department, task.description)
+        finally:
+            self._gate.release()
+        
+    def dispatch(self, task: Task) -> asyncio.Task:
+        """Add a task and start it as soon as its dependencies complete, without a planning barrier"""
+        self.add_task(task)
+        run = asyncio.create_task(self._run_when_ready(task))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._running.add(run)
+        run.add_done_callback(self._running.discard)
+        return run
+        
+    async def wait_dispatched(self, runs: List[asyncio.Task]):
+        """Wait for dispatched tasks; dependencies on tasks that were never added count as unmet"""
+        for task in list(self.tasks.values()):
+            for dep_id in task.dependencies:
+                if dep_id not in self.tasks:
+                    self._completion_event(dep_id).set()
+                    
+        await asyncio.gather(*runs, return_exceptions=True)
+        print(f"[WorkflowManager] ✅ Dispatched tasks finished. {len(self.completed_tasks)} tasks completed.")
+        
+    def _completion_event(self, task_id: str) -> asyncio.Event:
+        event = self._completion_events.get(task_id)
+        if event is None:
+            event = self._completion_events[task_id] = asyncio.Event()
+        return event
+        
+    async def _run_when_ready(self, task: Task):
+        """Wait for each dependency to finish, then run the task; sequential tasks still run one at a time"""
+        try:
+            for dep_id in task.dependencies:
+                await self._completion_event(dep_id).wait()
+                
+            if not self._can_execute(task):
+                print(f"[WorkflowManager] ⚠️ Skipping task {task.id} - dependencies not met")
+                return
+                
+            if task.phase == ExecutionPhase.SEQUENTIAL:
+                async with self._sequential_lock:
+                    await self._run_task(task)
+                    # Add delay between sequential tasks for better coordination
+                    await asyncio.sleep(1)
+            else:
+                await self._run_task(task)
+        finally:
+            self._completion_event(task.id).set()
+            
+    async def _run_task(self, task: Task):
+        print(f"[WorkflowManager] ⏳ Executing {task.phase.value} task: {task.id}")
+        task.status = "running"
+        try:
+            task.result = await self._assign(task)
+        except Exception as e:
+            print(f"[WorkflowManager] ❌ Task {task.id} failed: {e}")
+            task.status = "failed"
+            return
+            
+        task.status = "completed"
+        self.completed_tasks.add(task.id)
+        print(f"[WorkflowManager] ✅ Completed: {task.id}")
         
     def _can_execute(self, task: Task) -> bool:
         """Check if a task can be executed based on dependencies"""
@@ -26,6 +26,7 @@ try:
     from openpyxl import Workbook
     from openpyxl.styles import Font, PatternFill, Alignment
     from openpyxl.chart import BarChart, Reference
+    from openpyxl.utils import get_column_letter
     XLSX_AVAILABLE = True
 except ImportError:
     XLSX_AVAILABLE = False
@@ -199,28 +200,25 @@ class DocumentGenerator:
             if 'headers' in sheet_data and 'rows' in sheet_data:
                 # Add headers
                 headers = sheet_data['headers']
+                widths = [len(str(header)) for header in headers]
                 for col, header in enumerate(headers, 1):
                     cell = ws.cell(row=1, column=col, value=header)
                     cell.font = Font(bold=True)
                     cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
                 
-                # Add data rows
-                for row_idx, row_data in enumerate(sheet_data['rows'], 2):
-                    for col_idx, value in enumerate(row_data, 1):
-                        ws.cell(row=row_idx, column=col_idx, value=value)
+                # Add data rows; rows may be any iterable (e.g. a generator) and are consumed once,
+                # tracking column widths as they are written instead of rescanning the sheet
+                for row_data in sheet_data['rows']:
+                    row_data = tuple(row_data)
+                    ws.append(row_data)
+                    if len(row_data) > len(widths):
+                        widths.extend([0] * (len(row_data) - len(widths)))
+                    for col_idx, value in enumerate(row_data):
+                        widths[col_idx] = max(widths[col_idx], len(str(value)))
                 
                 # Auto-adjust column widths
-                for column in ws.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    ws.column_dimensions[column_letter].width = adjusted_width
+                for col_idx, max_length in enumerate(widths, 1):
+                    ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 50)
             
             # Add chart if specified
             if 'chart' in sheet_data:
@@ -7,7 +7,7 @@ import json
 import shutil
 import zipfile
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 
 try:
@@ -17,6 +17,16 @@ except ImportError:
     GOOGLE_DRIVE_AVAILABLE = False
 
 
+def iter_files(root: str):
+    """Recursively yield os.DirEntry objects for files under root (stat info is cached on the entry)"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
 class FileManager:
     """Central file management system for AI Agent Company"""
     
@@ -121,8 +131,8 @@ class FileManager:
         
         return session_dir
     
-    def save_file(self, content: bytes, filename: str, category: str, agent_name: str = None) -> str:
-        """Save file to appropriate category folder"""
+    def save_file(self, content: Union[str, bytes, bytearray, memoryview], filename: str, category: str, agent_name: str = None) -> str:
+        """Save file to appropriate category folder (str is written as UTF-8 text, bytes-like as-is)"""
         if not self.session_path:
             raise ValueError("Session not initialized. Call create_session_structure() first.")
         
@@ -185,14 +195,15 @@ class FileManager:
         for category, subdir in self.categories.items():
             category_path = os.path.join(self.session_path, subdir)
             if os.path.exists(category_path):
-                for filename in os.listdir(category_path):
-                    file_path = os.path.join(category_path, filename)
-                    if os.path.isfile(file_path):
-                        stat = os.stat(file_path)
+                with os.scandir(category_path) as entries:
+                    for entry in entries:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
                         files.append({
-                            'filename': filename,
+                            'filename': entry.name,
                             'category': category,
-                            'path': file_path,
+                            'path': entry.path,
                             'size': stat.st_size,
                             'created_at': datetime.fromtimestamp(stat.st_ctime).isoformat(),
                             'modified_at': datetime.fromtimestamp(stat.st_mtime).isoformat()
@@ -241,11 +252,9 @@ class FileManager:
                 archive_path = os.path.join(os.path.dirname(self.session_path), archive_name)
                 
                 with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for root, dirs, files in os.walk(self.session_path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            arcname = os.path.relpath(file_path, self.session_path)
-                            zipf.write(file_path, arcname)
+                    for entry in iter_files(self.session_path):
+                        arcname = os.path.relpath(entry.path, self.session_path)
+                        zipf.write(entry.path, arcname)
             
             # Remove session directory
             shutil.rmtree(self.session_path)
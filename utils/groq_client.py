@@ -0,0 +1,22 @@
+"""
+Groq Client Module
+Shared ChatGroq instances, one per (temperature, model, key), so agents reuse a
+single client and its HTTP connection pool instead of each opening their own.
+The Groq API key is resolved once at import rather than in every agent.
+"""
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+GROQ_API_KEY = os.getenv('GROQ_API_KEY') or os.getenv('GROQ_API_KEY_1') or os.getenv('GROQ_API_KEY_2')
+
+
+@lru_cache(maxsize=8)
+def get_groq_client(temperature: float, model_name: str, api_key: str):
+    """Get the shared ChatGroq client for these settings, creating it on first use"""
+    # Imported lazily so processes that never talk to Groq never load LangChain
+    from langchain_groq import ChatGroq
+    return ChatGroq(temperature=temperature, model_name=model_name, api_key=api_key)
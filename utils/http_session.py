@@ -0,0 +1,17 @@
+"""
+HTTP Session Module
+One process-wide requests.Session with a pooled adapter, so LLM, research and
+webhook calls reuse warm keep-alive connections instead of paying a TCP+TLS
+handshake per request.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+# Sized for the default asyncio.to_thread executor, which caps concurrent callers at 32
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+http_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+http_session.mount("https://", _adapter)
+http_session.mount("http://", _adapter)
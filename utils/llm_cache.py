@@ -0,0 +1,144 @@
+"""
+LLM Cache Module
+In-process LRU cache for LLM responses, keyed on a hash of the exact prompt
+(system message included) within a per-template scope.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from utils.llm_planner import acall_llm, call_llm, coalesce, MODEL_NAME
+
+LLM_CACHE_MAX_ENTRIES = 5000
+
+# call_llm reports failures in-band; such responses are never cached
+_ERROR_MARKER = "❌ Error:"
+
+
+def is_error_response(response: str) -> bool:
+    """True if response is call_llm's in-band failure message rather than a completion"""
+    return _ERROR_MARKER in response
+
+
+class LLMResponseCache:
+    """Thread-safe LRU of prompt -> response per namespace"""
+
+    def __init__(self, max_entries: int = LLM_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(prompt: str, namespace: str = "") -> str:
+        return hashlib.blake2b(f"{namespace}\0{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, prompt: str, namespace: str = "") -> Optional[str]:
+        """Return the cached response for an identical prompt, if any"""
+        key = self.make_key(prompt, namespace)
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return response
+
+    def put(self, prompt: str, response: str, namespace: str = ""):
+        """Cache a response, evicting the least recently used entry when full"""
+        key = self.make_key(prompt, namespace)
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"size": len(self._entries), "max_size": self.max_entries, **self._stats}
+
+
+llm_cache = LLMResponseCache()
+
+
+def _call_llm_namespace(scope: str) -> str:
+    return f"call_llm:{MODEL_NAME}:{scope}"
+
+
+def _chat_namespace(llm, scope: str) -> str:
+    return f"chat:{getattr(llm, 'model_name', '')}:{getattr(llm, 'temperature', '')}:{scope}"
+
+
+def _cache_prompt(prompt: str, system: str = None) -> str:
+    return f"{system}\0{prompt}" if system else prompt
+
+
+def cached_call_llm(prompt: str, scope: str = "", system: str = None) -> str:
+    """call_llm with response caching; scope names the prompt template"""
+    namespace = _call_llm_namespace(scope)
+    key_prompt = _cache_prompt(prompt, system)
+    response = llm_cache.get(key_prompt, namespace)
+    if response is not None:
+        return response
+
+    response = call_llm(prompt, system)
+    if not is_error_response(response):
+        llm_cache.put(key_prompt, response, namespace)
+    return response
+
+
+async def acached_call_llm(prompt: str, scope: str = "", system: str = None) -> str:
+    """Async cached_call_llm; the LLM round trip runs off the event loop"""
+    namespace = _call_llm_namespace(scope)
+    key_prompt = _cache_prompt(prompt, system)
+    response = llm_cache.get(key_prompt, namespace)
+    if response is not None:
+        return response
+
+    response = await acall_llm(prompt, system)
+    if not is_error_response(response):
+        llm_cache.put(key_prompt, response, namespace)
+    return response
+
+
+async def acached_chat(llm, prompt: str, scope: str = "",
+                       on_chunk: Callable[[str], Any] = None, system: str = None) -> str:
+    """Invoke a LangChain chat model natively async with response caching
+    (scoped to its model and temperature); with on_chunk the completion is
+    streamed and each chunk passed to on_chunk as it arrives"""
+    from langchain.schema.messages import HumanMessage, SystemMessage
+
+    namespace = _chat_namespace(llm, scope)
+    key_prompt = _cache_prompt(prompt, system)
+    response = llm_cache.get(key_prompt, namespace)
+    if response is not None:
+        return response
+
+    messages = [HumanMessage(content=prompt)]
+    if system:
+        messages.insert(0, SystemMessage(content=system))
+    if on_chunk is None:
+        factory = lambda: _invoke(llm, messages)
+    else:
+        factory = lambda: _stream(llm, messages, on_chunk)
+    response = (await coalesce((namespace, key_prompt), factory)).strip()
+    llm_cache.put(key_prompt, response, namespace)
+    return response
+
+
+async def _invoke(llm, messages) -> str:
+    return (await llm.ainvoke(messages)).content
+
+
+async def _stream(llm, messages, on_chunk: Callable[[str], Any]) -> str:
+    chunks = []
+    async for chunk in llm.astream(messages):
+        chunks.append(chunk.content)
+        on_chunk(chunk.content)
+    return "".join(chunks)
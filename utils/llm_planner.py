@@ -1,8 +1,11 @@
 import os
 import requests
 import asyncio
+import random
+import threading
 import time
 from dotenv import load_dotenv
+from utils.http_session import http_session
 
 load_dotenv()
 
@@ -13,20 +16,48 @@ ENDPOINT = "https://api.groq.com/openai/v1/chat/completions"
 # Rate limiting variables
 last_request_time = 0
 min_request_interval = 2  # Minimum 2 seconds between requests
+_rate_limit_lock = threading.Lock()  # call_llm may run concurrently in worker threads
 
-def call_llm(prompt: str) -> str:
+# Rounds over the API keys when every key fails transiently (rate limits, 5xx, network errors)
+LLM_MAX_ATTEMPTS = 3
+LLM_RETRY_BACKOFF = 1.0  # Seconds; doubles each retry, plus up to this much jitter
+
+def call_llm(prompt: str, system: str = None) -> str:
+    """Send prompt as the user message; the optional system message carries the fixed
+    instructions so they form a stable prefix the provider can cache across calls"""
     global last_request_time
     
-    # Rate limiting - wait if needed
-    current_time = time.time()
-    time_since_last = current_time - last_request_time
-    if time_since_last < min_request_interval:
-        wait_time = min_request_interval - time_since_last
+    # Rate limiting - reserve the next send slot, then wait for it outside the lock
+    with _rate_limit_lock:
+        current_time = time.time()
+        wait_time = max(0.0, last_request_time + min_request_interval - current_time)
+        last_request_time = current_time + wait_time
+    if wait_time > 0:
         print(f"[LLMPlanner] ⏳ Rate limiting: waiting {wait_time:.1f}s...")
         time.sleep(wait_time)
     
-    last_request_time = time.time()
-    
+    messages = [{"role": "user", "content": prompt}]
+    if system:
+        messages.insert(0, {"role": "system", "content": system})
+
+    for attempt in range(LLM_MAX_ATTEMPTS):
+        if attempt:
+            # Exponential backoff with jitter so concurrent callers do not retry in lockstep
+            delay = LLM_RETRY_BACKOFF * 2 ** (attempt - 1) + random.uniform(0, LLM_RETRY_BACKOFF)
+            print(f"[LLMPlanner] 🔁 Transient failure on every key, retry {attempt} in {delay:.1f}s...")
+            time.sleep(delay)
+
+        content, transient = _post_with_keys(messages)
+        if content is not None:
+            return content
+        if not transient:
+            break
+
+    return "[LLMPlanner] ❌ Error: All API keys failed. Check .env or usage limits."
+
+def _post_with_keys(messages):
+    """Try each API key once; returns (content, None) on success, else (None, whether any failure was transient)"""
+    transient = False
     for key in API_KEYS:
         if not key:
             continue
@@ -37,36 +68,61 @@ def call_llm(prompt: str) -> str:
         }
         payload = {
             "model": MODEL_NAME,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": messages,
             "temperature": 0.7,
             "max_tokens": 1000  # Limit response length to avoid long processing
         }
 
         try:
-            response = requests.post(ENDPOINT, headers=headers, json=payload, timeout=15)
+            response = http_session.post(ENDPOINT, headers=headers, json=payload, timeout=15)
             
             if response.status_code == 429:
                 print(f"[LLMPlanner] ⏳ Rate limit hit, waiting 5 seconds...")
+                transient = True
                 time.sleep(5)
                 continue
                 
             response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"]
+            return response.json()["choices"][0]["message"]["content"], None
             
         except requests.exceptions.HTTPError as e:
             if "429" in str(e):
                 print(f"[LLMPlanner] ⏳ Rate limit exceeded, trying next key...")
+                transient = True
                 time.sleep(3)
                 continue
+            if e.response is not None and e.response.status_code >= 500:
+                transient = True
             print(f"[LLMPlanner] ⚠️ HTTP error with key: {key[:6]}... — {e}")
             continue
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            transient = True
+            print(f"[LLMPlanner] ⚠️ Network error with key: {key[:6]}... — {e}")
+            continue
         except Exception as e:
             print(f"[LLMPlanner] ⚠️ Failed with key: {key[:6]}... — {e}")
             continue
 
-    return "[LLMPlanner] ❌ Error: All API keys failed. Check .env or usage limits."
+    return None, transient
+
+# In-flight LLM calls by key; concurrent identical requests share one call
+_inflight = {}
+
+async def coalesce(key, factory):
+    """Await the in-flight call for key, or start it with factory() if there is none"""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one cancelled waiter does not cancel the call for the others
+    return await asyncio.shield(task)
+
+async def acall_llm(prompt: str, system: str = None) -> str:
+    """Run call_llm in a worker thread so the event loop keeps serving other agents;
+    identical prompts already in flight share the same call"""
+    return await coalesce(("call_llm", system, prompt), lambda: asyncio.to_thread(call_llm, prompt, system))
 
 # Optional: Async wrapper if any agent uses it in asyncio tasks
 async def llm_chat(prompt: str) -> str:
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, call_llm, prompt)
\ No newline at end of file
+    return await acall_llm(prompt)
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""
+Memory Writer Module
+Applies agent memory writes on a background thread so agents can return as soon
+as a result is ready. A single consumer keeps writes in submission order, and
+anything still queued is flushed at interpreter exit.
+"""
+import atexit
+import logging
+import queue
+import threading
+from typing import Any, Callable
+
+MEMORY_WRITE_BATCH_SIZE = 32
+
+_logger = logging.getLogger(__name__)
+
+
+class MemoryWriter:
+    """FIFO queue of memory writes drained in batches by one daemon thread"""
+
+    def __init__(self, batch_size: int = MEMORY_WRITE_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, write: Callable[..., Any], *args, **kwargs):
+        """Queue write(*args, **kwargs) to run on the writer thread"""
+        if self._thread is None:
+            self._start()
+        self._queue.put((write, args, kwargs))
+
+    def flush(self):
+        """Block until every queued write has been applied"""
+        self._queue.join()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="memory-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for write, args, kwargs in batch:
+                try:
+                    write(*args, **kwargs)
+                except Exception:
+                    _logger.exception("Background memory write failed")
+                finally:
+                    self._queue.task_done()
+
+
+memory_writer = MemoryWriter()
@@ -0,0 +1,101 @@
+"""
+Project Store Module
+Durable per-agent project history in SQLite (WAL journal), replacing in-memory
+lists of full LLM results. Counts come from an index instead of a list scan.
+Rows are keyed by the agent's name, which is stable across runs, and each agent
+keeps only its most recent PROJECT_RETENTION projects so the file stays bounded.
+"""
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Tuple
+
+DEFAULT_PROJECT_DB_PATH = os.getenv("PROJECT_STORE_PATH", os.path.join(".cache", "projects.sqlite"))
+PROJECT_RETENTION = 1000  # Most recent projects kept per agent
+
+_INSERT_PROJECT = "INSERT INTO projects (agent_id, task, result, timestamp, status) VALUES (?, ?, ?, ?, ?)"
+# Drop an agent's rows older than its newest `retention`
+_PRUNE_PROJECTS = (
+    "DELETE FROM projects WHERE agent_id = ? AND id <= "
+    "(SELECT id FROM projects WHERE agent_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?)"
+)
+
+
+class ProjectStore:
+    """SQLite-backed project history, safe to share between threads"""
+
+    def __init__(self, db_path: str = DEFAULT_PROJECT_DB_PATH, retention: int = PROJECT_RETENTION):
+        self.db_path = db_path
+        self.retention = retention
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Autocommit; WAL with synchronous=NORMAL fsyncs at checkpoints rather than on every insert
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS projects ("
+                "id INTEGER PRIMARY KEY, agent_id TEXT NOT NULL, task TEXT NOT NULL, "
+                "result TEXT NOT NULL, timestamp TEXT, status TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_agent_status ON projects (agent_id, status)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_agent_id ON projects (agent_id, id)")
+
+    def insert(self, agent_id: str, task: str, result: str, timestamp: str, status: str):
+        """Record a project for an agent (agent_id is the agent's stable name), pruning
+        the agent's history down to the retention limit"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(_INSERT_PROJECT, (agent_id, task, result, timestamp, status))
+                self._conn.execute(_PRUNE_PROJECTS, (agent_id, agent_id, self.retention))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def counts(self, agent_id: str) -> Tuple[int, int]:
+        """(total, completed) project counts for an agent"""
+        with self._lock:
+            total = self._conn.execute(
+                "SELECT COUNT(*) FROM projects WHERE agent_id = ?", (agent_id,)
+            ).fetchone()[0]
+            completed = self._conn.execute(
+                "SELECT COUNT(*) FROM projects WHERE agent_id = ? AND status = 'completed'", (agent_id,)
+            ).fetchone()[0]
+        return total, completed
+
+    def recent(self, agent_id: str, limit: int) -> List[Dict[str, Any]]:
+        """An agent's most recent projects, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task, result, timestamp, status FROM projects WHERE agent_id = ? "
+                "ORDER BY id DESC LIMIT ?", (agent_id, limit)
+            ).fetchall()
+        return [
+            {"task": task, "result": result, "timestamp": timestamp, "status": status}
+            for task, result, timestamp, status in reversed(rows)
+        ]
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+_project_store = None
+_project_store_lock = threading.Lock()
+
+
+def get_project_store() -> ProjectStore:
+    """Get the process-wide project store, creating it on first use"""
+    global _project_store
+    if _project_store is None:
+        with _project_store_lock:
+            if _project_store is None:
+                _project_store = ProjectStore()
+    return _project_store
@@ -0,0 +1,73 @@
+"""
+Prompt Cache Module
+Persistent cache of LLM responses keyed by a hash of the prompt, so identical
+prompts are answered from disk instead of paying for another LLM round trip.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+DEFAULT_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(".cache", "llm_responses.sqlite"))
+
+
+class PromptCache:
+    """SQLite-backed prompt -> response cache, safe to share between threads"""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH):
+        self.db_path = db_path
+        cache_dir = os.path.dirname(db_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(prompt: str, namespace: str = "") -> str:
+        """BLAKE2b digest of the prompt, scoped by namespace (e.g. model and temperature)"""
+        return hashlib.blake2b(f"{namespace}\0{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, prompt: str, namespace: str = "") -> Optional[str]:
+        """Return the cached response for prompt, or None"""
+        key = self.make_key(prompt, namespace)
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, prompt: str, response: str, namespace: str = ""):
+        """Store the response for prompt"""
+        key = self.make_key(prompt, namespace)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                (key, response, time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+_prompt_cache = None
+_prompt_cache_lock = threading.Lock()
+
+
+def get_prompt_cache() -> PromptCache:
+    """Get the process-wide prompt cache, creating it on first use"""
+    global _prompt_cache
+    if _prompt_cache is None:
+        with _prompt_cache_lock:
+            if _prompt_cache is None:
+                _prompt_cache = PromptCache()
+    return _prompt_cache
@@ -0,0 +1,20 @@
+"""
+Prompt Utilities Module
+Helpers for keeping variable prompt inputs (e.g. research payloads) within a
+size budget, since LLM latency and cost grow with input tokens.
+"""
+from typing import Any
+
+RESEARCH_CHAR_LIMIT = 2000
+
+
+def clip(text: Any, limit: int = RESEARCH_CHAR_LIMIT) -> str:
+    """Cap text at limit characters with an ellipsis, cutting at a line break when one is near the end"""
+    text = str(text)
+    if len(text) <= limit:
+        return text
+
+    cut = text.rfind("\n", 0, limit)
+    if cut < limit * 0.8:
+        cut = limit
+    return text[:cut].rstrip() + " …"
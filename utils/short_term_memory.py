@@ -0,0 +1,136 @@
+"""
+Short-Term Memory Module
+Keeps an agent's most recent task results in-process so repeat or adjacent
+queries can be answered without a round trip to the vector store.
+"""
+import math
+import re
+import zlib
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+EMBEDDING_DIM = 256
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def embed_text(text: str) -> Dict[int, float]:
+    """Hashed bag-of-words embedding as a sparse, L2-normalised {bucket: weight} dict"""
+    vector: Dict[int, float] = {}
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        bucket = zlib.crc32(token.encode()) % EMBEDDING_DIM
+        vector[bucket] = vector.get(bucket, 0.0) + 1.0
+
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    if norm:
+        for bucket in vector:
+            vector[bucket] /= norm
+    return vector
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _cosine_scores(matrix, query):
+        """Dot every (unit-length) row of matrix with query in one fused loop"""
+        rows, dims = matrix.shape
+        scores = np.empty(rows, dtype=np.float32)
+        for i in range(rows):
+            acc = np.float32(0.0)
+            for j in range(dims):
+                acc += matrix[i, j] * query[j]
+            scores[i] = acc
+        return scores
+elif NUMPY_AVAILABLE:
+    def _cosine_scores(matrix, query):
+        """Dot every (unit-length) row of matrix with query as a single gemv"""
+        return matrix @ query
+
+
+class ShortTermMemory:
+    """Bounded ring buffer of recent memories searched with cosine similarity"""
+
+    def __init__(self, max_entries: int = 256, threshold: float = 0.5):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._contents: List[Optional[str]] = [None] * max_entries
+        self._metadata: List[Optional[Dict[str, Any]]] = [None] * max_entries
+        self._size = 0
+        self._next = 0
+
+        # Embeddings live in one contiguous float32 matrix when NumPy is available,
+        # otherwise as sparse dicts scanned in pure Python
+        if NUMPY_AVAILABLE:
+            self._matrix = np.zeros((max_entries, EMBEDDING_DIM), dtype=np.float32)
+        else:
+            self._vectors: List[Optional[Dict[int, float]]] = [None] * max_entries
+
+    @staticmethod
+    def _dense(vector: Dict[int, float]):
+        dense = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+        for bucket, weight in vector.items():
+            dense[bucket] = weight
+        return dense
+
+    def add(self, content: str, metadata: Optional[Dict[str, Any]] = None):
+        """Add a memory, overwriting the oldest one when full"""
+        slot = self._next
+        vector = embed_text(content)
+        if NUMPY_AVAILABLE:
+            self._matrix[slot] = self._dense(vector)
+        else:
+            self._vectors[slot] = vector
+        self._contents[slot] = content
+        self._metadata[slot] = metadata or {}
+        self._next = (slot + 1) % self.max_entries
+        self._size = min(self._size + 1, self.max_entries)
+
+    def search(self, query: str, top_k: int = 3) -> List[Dict[str, Any]]:
+        """Return up to top_k memories whose similarity to the query passes the threshold"""
+        query_vector = embed_text(query)
+        if not query_vector or not self._size:
+            return []
+
+        if NUMPY_AVAILABLE:
+            scores = _cosine_scores(self._matrix[:self._size], self._dense(query_vector))
+            slots = np.flatnonzero(scores >= self.threshold)
+            if len(slots) > top_k:
+                slots = slots[np.argpartition(scores[slots], -top_k)[-top_k:]]
+            hits = [(float(scores[slot]), int(slot)) for slot in slots]
+        else:
+            hits = []
+            for slot in range(self._size):
+                vector = self._vectors[slot]
+                score = sum(weight * vector.get(bucket, 0.0) for bucket, weight in query_vector.items())
+                if score >= self.threshold:
+                    hits.append((score, slot))
+
+        hits.sort(key=lambda hit: hit[0], reverse=True)
+        return [
+            {
+                "content": self._contents[slot],
+                "metadata": self._metadata[slot],
+                "similarity_score": score,
+                "source": "short_term"
+            }
+            for score, slot in hits[:top_k]
+        ]
+
+    def clear(self):
+        """Drop all short-term memories"""
+        self._contents = [None] * self.max_entries
+        self._metadata = [None] * self.max_entries
+        self._size = 0
+        self._next = 0
+
+    def __len__(self):
+        return self._size